@@ -0,0 +1,58 @@
+"""Measures allocations and time per `+` on counting loops
+
+Adds a step to a running Number 50k times, keeping every result alive, and
+counts the memory blocks still allocated afterwards. Each loop runs once
+before it is traced, so results that are interned cost no new blocks. Pass
+git revisions as arguments to compare them with the working tree.
+"""
+
+# ruff: noqa: INP001
+from __future__ import annotations
+
+import tracemalloc
+from functools import partial
+
+from harness import best_of, compare, number, run_samarium
+from samarium.classes import Num, Number
+
+ITERATIONS = 50_000
+CASES = {
+    "small ints": (0, 1),
+    "large ints": (10**12, 1),
+    "floats": (0.5, 1),
+}
+
+
+def count(start: Number, step: Number, results: list[Number]) -> None:
+    x = start
+    for i in range(len(results)):
+        x = x + step
+        results[i] = x
+
+
+def blocks_per_add(start: Number, step: Number) -> float:
+    results: list[Number] = [start] * ITERATIONS
+    count(start, step, results)
+    tracemalloc.start()
+    count(start, step, results)
+    blocks = len(tracemalloc.take_snapshot().traces)
+    tracemalloc.stop()
+    return blocks / ITERATIONS
+
+
+def main() -> None:
+    for name, (start, step) in CASES.items():
+        blocks = blocks_per_add(Num(start), Num(step))
+        results: list[Number] = [Num(start)] * ITERATIONS
+        elapsed = best_of(partial(count, Num(start), Num(step), results))
+        print(
+            f"{name:>12}: {blocks:>5.2f} new blocks per +, "
+            f"{elapsed / ITERATIONS * 1e9:>6.0f} ns per +"
+        )
+    loop = rf"i: \; .. i < {number(ITERATIONS)} {{ i+: /; }}"
+    elapsed = best_of(partial(run_samarium, loop))
+    print(f"{'i+: / loop':>12}: {elapsed / ITERATIONS * 1e9:>6.0f} ns per iteration")
+
+
+if __name__ == "__main__":
+    compare(main)
@@ -0,0 +1,41 @@
+"""Measures assignment-heavy loops
+
+Each loop assigns a fresh value on every iteration, 100k times (1k times for
+the 10k-element array). Pass git revisions as arguments to compare them with
+the working tree.
+"""
+
+# ruff: noqa: INP001
+from __future__ import annotations
+
+from functools import partial
+
+from harness import best_of, compare, number, run_samarium
+
+LOOP = r"""{setup}
+i: \;
+.. i < {n} {{
+    {body}
+    i+: /;
+}}
+"""
+BIG = f"big: []?!(<<..{number(10_000)}>>);"
+CASES = {
+    "numbers": ("", r"x: i ++ /\ + /;", 100_000),
+    "strings": ("", r'x: "i = " + ""?!(i);', 100_000),
+    "arrays": ("", r"x: [i, i, i];", 100_000),
+    "tables": ("", r"x: {{i -> i}};", 100_000),
+    "in place": (r"x: \;", r"x+: i;", 100_000),
+    "10k-element array": (BIG, "x: big;", 1_000),
+}
+
+
+def main() -> None:
+    for name, (setup, body, iterations) in CASES.items():
+        code = LOOP.format(setup=setup, n=number(iterations), body=body)
+        elapsed = best_of(partial(run_samarium, code), 3)
+        print(f"{name:>18}: {elapsed * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    compare(main)
@@ -0,0 +1,56 @@
+"""Measures attribute reads and method calls on instances of Samarium classes
+
+Each loop repeats a single access 100k times. Pass git revisions as arguments
+to compare them with the working tree.
+"""
+
+# ruff: noqa: INP001
+from __future__ import annotations
+
+from functools import partial
+
+from harness import best_of, compare, number, run_samarium
+
+ITERATIONS = 100_000
+LOOP = r"""@ Point {{
+    shared: /;
+
+    => x y * {{
+        'x: x;
+        'y: y;
+    }}
+
+    norm * {{
+        * 'x ++ 'x + 'y ++ 'y;
+    }}
+
+    move dx * {{
+        'x+: dx;
+    }}
+}}
+
+p: Point(/, /\);
+i: \;
+.. i < {n} {{
+    {body}
+    i+: /;
+}}
+"""
+BODIES = {
+    "loop only": "v: i;",
+    "instance attribute": "v: p.x;",
+    "class attribute": "v: p.shared;",
+    "method call": "v: p.norm();",
+    "method with argument": "p.move(/);",
+}
+
+
+def main() -> None:
+    for name, body in BODIES.items():
+        code = LOOP.format(n=number(ITERATIONS), body=body)
+        elapsed = best_of(partial(run_samarium, code), 3)
+        print(f"{name:>20}: {elapsed * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    compare(main)
@@ -0,0 +1,46 @@
+"""Measures building an array and a string with `+:` in a loop
+
+Grows both to 1k, 10k, 100k and 1M elements. Once a size takes more than
+twice as long per element as the previous one, larger sizes are skipped, so
+revisions that copy on every `+:` finish too. Pass git revisions as arguments
+to compare them with the working tree.
+"""
+
+# ruff: noqa: INP001
+from __future__ import annotations
+
+from functools import partial
+
+from harness import best_of, compare, number, run_samarium
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+# Each size is 10 times the previous one
+MAX_GROWTH = 20
+LOOP = r"""x: {empty};
+i: \;
+.. i < {n} {{
+    x+: {item};
+    i+: /;
+}}
+"""
+CASES = {
+    "array": ("[]", "[i]"),
+    "string": ('""', '"abc"'),
+}
+
+
+def main() -> None:
+    for name, (empty, item) in CASES.items():
+        timings: list[float] = []
+        for n in SIZES:
+            if len(timings) > 1 and timings[-1] / timings[-2] > MAX_GROWTH:
+                print(f"{name:>6} {n:>9,}: skipped")
+                continue
+            code = LOOP.format(empty=empty, n=number(n), item=item)
+            elapsed = best_of(partial(run_samarium, code), 1)
+            timings.append(elapsed)
+            print(f"{name:>6} {n:>9,}: {elapsed * 1000:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    compare(main)
@@ -0,0 +1,57 @@
+"""Measures the overhead of calling Samarium functions
+
+Times 100k calls of functions with no, fixed and variable arguments, a method
+call and a recursive function. Pass git revisions as arguments to compare
+them with the working tree.
+"""
+
+# ruff: noqa: INP001
+from __future__ import annotations
+
+from functools import partial
+
+from harness import best_of, compare, number, run_samarium
+
+ITERATIONS = 100_000
+LOOP = r"""none * {{ * /; }}
+pair a b * {{ * a; }}
+packed args... * {{ * args; }}
+
+@ Box {{
+    => * {{ 'v: /; }}
+    get * {{ * 'v; }}
+}}
+
+fib n * {{
+    ? n < /\ {{ * n; }}
+    * fib(n - /) + fib(n - /\);
+}}
+
+box: Box();
+i: \;
+.. i < {n} {{
+    {body}
+    i+: /;
+}}
+"""
+BODIES = {
+    "no arguments": "none();",
+    "two arguments": r"pair(i, /\);",
+    "varargs": r"packed(i, /\, //);",
+    "method": "box.get();",
+}
+# fib(25) makes about 250k calls on its own
+RECURSIVE = LOOP.format(n="/", body=r"fib(//\\/);")
+
+
+def main() -> None:
+    for name, body in BODIES.items():
+        code = LOOP.format(n=number(ITERATIONS), body=body)
+        elapsed = best_of(partial(run_samarium, code), 3)
+        print(f"{name:>14}: {elapsed * 1000:>8.1f} ms")
+    elapsed = best_of(partial(run_samarium, RECURSIVE), 3)
+    print(f"{'fib(25)':>14}: {elapsed * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    compare(main)
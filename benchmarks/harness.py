@@ -0,0 +1,77 @@
+"""Helpers shared by the benchmark scripts"""
+
+# ruff: noqa: INP001
+from __future__ import annotations
+
+import io
+import os
+import subprocess
+import sys
+import tarfile
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING, Any
+
+from samarium.core import run
+from samarium.runtime import Runtime
+from samarium.transpiler import Registry
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def best_of(func: Callable[[], object], runs: int = 5) -> float:
+    """Returns the fastest of `runs` timings of `func`, in seconds"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def number(n: int) -> str:
+    """Returns the Samarium literal for the non-negative integer `n`"""
+    return bin(n)[2:].translate(str.maketrans("01", "\\/"))
+
+
+def run_samarium(code: str, *, optimize: bool = False) -> None:
+    """Runs `code` in-process, as `samarium [-O]` would run a script"""
+    Runtime.optimize = optimize
+    try:
+        run(code, Registry({}), "<benchmark>", load_template=False)
+    finally:
+        Runtime.optimize = False
+
+
+def compare(main: Callable[[], None]) -> None:
+    """Runs `main` on each git revision given as an argument, then on the tree
+
+    Revisions are exported to a temporary directory and the calling script is
+    rerun against them, so every implementation is measured the same way.
+    """
+    for revision in sys.argv[1:]:
+        print(f"== {revision}", flush=True)
+        archive = subprocess.run(
+            ["git", "archive", revision, "src"],
+            cwd=ROOT,
+            capture_output=True,
+            check=True,
+        ).stdout
+        with TemporaryDirectory() as tmp:
+            with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+                tar.extractall(tmp)
+            env = os.environ | {"PYTHONPATH": str(Path(tmp, "src"))}
+            subprocess.run([sys.executable, sys.argv[0]], env=env, check=True)
+    if sys.argv[1:]:
+        print("== working tree", flush=True)
+    main()
+
+
+def load_samarium(code: str) -> dict[str, Any]:
+    """Runs `code` in-process and returns its variables by their Samarium names"""
+    reg = run(code, Registry({}), "<benchmark>", load_template=False)
+    return {k.removeprefix("sm_"): v for k, v in reg.vars.items() if k[:3] == "sm_"}
@@ -0,0 +1,43 @@
+"""Measures literal-heavy loops with and without the -O optimizer
+
+Each loop repeats arithmetic, string and comparison expressions made only of
+literals, which -O folds at compile time and hoists out of the loop.
+"""
+
+# ruff: noqa: INP001
+from __future__ import annotations
+
+from functools import partial
+
+from harness import best_of, number, run_samarium
+
+ITERATIONS = 100_000
+LOOP = r"""i: \;
+.. i < {n} {{
+    {body}
+    i+: /;
+}}
+"""
+BODIES = {
+    "arithmetic": r"x: /\/ ++ /\/\ + /\/\/ --- /// - /\\/;",
+    "strings": r's: "literal" + "-" + "heavy" ++ //;',
+    "comparisons": r"b: /\/ > // && /\\ ::: /\/ || /// <: /\;",
+    "hoisting": r'p: [/, /\, //, /\\]; t: {{"a" -> /, "b" -> /\}};',
+}
+
+
+def main() -> None:
+    for name, body in BODIES.items():
+        code = LOOP.format(n=number(ITERATIONS), body=body)
+        plain, optimized = (
+            best_of(partial(run_samarium, code, optimize=optimize), 3)
+            for optimize in (False, True)
+        )
+        print(
+            f"{name:>12}: {plain * 1000:>8.1f} ms, -O {optimized * 1000:>8.1f} ms "
+            f"({plain / optimized:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Measures random 4 KB reads from a regular and a memory-mapped file
+
+Reads 100k blocks at random offsets, touching every page of each block so
+that mapped reads pay for their page faults. By default the file is a sparse
+4 GB temporary file, which measures the cost of each read rather than of the
+disk; pass the path of an existing file to read real data instead.
+"""
+
+# ruff: noqa: INP001
+from __future__ import annotations
+
+import random
+import sys
+from functools import partial
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from harness import best_of
+from samarium.classes import File, FileManager, Mode, Num, Slice, String
+
+SIZE = 4 * 1024**3
+BLOCK = 4096
+READS = 100_000
+
+
+def read_blocks(file: File, offsets: list[int]) -> None:
+    for start in offsets:
+        block = file[Slice(Num(start), Num(start + BLOCK))]
+        sum(block.val[::512])
+
+
+def measure(path: Path) -> None:
+    size = path.stat().st_size
+    rng = random.Random(0)
+    offsets = [rng.randrange(size - BLOCK) for _ in range(READS)]
+    for mode in (Mode.READ, Mode.MAP):
+        file = FileManager.open(String(str(path)), mode, binary=True)
+        elapsed = best_of(partial(read_blocks, file, offsets), 3)
+        ~file  # noqa: B018
+        print(
+            f"{mode.name:>5}: {READS / elapsed:>10,.0f} reads/s, "
+            f"{READS * BLOCK / elapsed / 1e6:>8,.0f} MB/s"
+        )
+
+
+def main() -> None:
+    if sys.argv[1:]:
+        measure(Path(sys.argv[1]))
+        return
+    with TemporaryDirectory() as tmp:
+        path = Path(tmp, "sparse.bin")
+        with path.open("wb") as f:
+            f.truncate(SIZE)
+        measure(path)
+
+
+if __name__ == "__main__":
+    main()
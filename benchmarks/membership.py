@@ -0,0 +1,34 @@
+"""Measures membership tests and deduplication on 100k-element arrays
+
+The arrays being deduplicated hold 100 distinct numbers and 2 distinct
+unhashable arrays, so revisions with quadratic deduplication finish too. Pass
+git revisions as arguments to compare them with the working tree.
+"""
+
+# ruff: noqa: INP001
+from __future__ import annotations
+
+from harness import best_of, compare
+from samarium.classes import Array, Num, String
+
+SIZE = 100_000
+
+
+def main() -> None:
+    numbers = Array([Num(i) for i in range(SIZE)])
+    repeated = Array([Num(i % 100) for i in range(SIZE)])
+    pairs = Array([Array([Num(i % 2)]) for i in range(SIZE)])
+    last, missing = Num(SIZE - 1), String("a")
+    cases = {
+        "last element ->?": lambda: last in numbers,
+        "missing string ->?": lambda: missing in numbers,
+        "dedup with -": lambda: -repeated,
+        "dedup arrays with -": lambda: -pairs,
+        "drop repeats with ---": lambda: repeated % Num(1),
+    }
+    for name, operation in cases.items():
+        print(f"{name:>22}: {best_of(operation) * 1000:>7.1f} ms")
+
+
+if __name__ == "__main__":
+    compare(main)
@@ -0,0 +1,55 @@
+"""Compares NumArray with ArithmeticArray and plain comprehension loops
+
+Applies element-wise operators and a sum to 100k numbers, with each approach
+wrapped in a Samarium function.
+"""
+
+# ruff: noqa: INP001
+from __future__ import annotations
+
+from functools import partial
+
+from harness import best_of, load_samarium, number
+
+SIZE = 100_000
+SETUP = rf"""<=collections.[ArithmeticArray, NumArray];
+
+values: []?!(<<..{number(SIZE)}>>);
+aa: ArithmeticArray(values);
+na: NumArray(values);
+
+add a * {{ * a + /\; }}
+mul a * {{ * a ++ //; }}
+gt a * {{ * a > /\/; }}
+total a * {{ * a.sum(); }}
+
+add_loop a * {{ * [i + /\ ... i ->? a]; }}
+mul_loop a * {{ * [i ++ // ... i ->? a]; }}
+gt_loop a * {{ * [i > /\/ ... i ->? a]; }}
+total_loop a * {{
+    s: \;
+    ... i ->? a {{ s+: i; }}
+    * s;
+}}
+"""
+OPERATIONS = {"+ /\\": "add", "++ //": "mul", "> /\\/": "gt", "sum": "total"}
+
+
+def main() -> None:
+    env = load_samarium(SETUP)
+    print(f"{'':>8} {'loop':>10} {'Arithmetic':>10} {'NumArray':>10}")
+    for name, function in OPERATIONS.items():
+        timings = [best_of(partial(env[f"{function}_loop"], env["values"]))]
+        if function == "total":
+            timings.append(None)
+        else:
+            timings.append(best_of(partial(env[function], env["aa"])))
+        timings.append(best_of(partial(env[function], env["na"])))
+        print(
+            f"{name:>8}",
+            *(f"{'-':>10}" if t is None else f"{t * 1000:>7.1f} ms" for t in timings),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Measures pushing and then popping N items with Stack, Queue and Deque
+
+Each case fills the collection with 1k, 10k, 100k and 1M items and then
+empties it again. A size is skipped once the previous one suggests it would
+take longer than BUDGET seconds, so revisions whose pops shift the whole
+backing array finish too. Pass git revisions as arguments to compare
+them with the working tree, e.g. `d3c72a1~` for the array-backed versions.
+"""
+
+# ruff: noqa: INP001
+from __future__ import annotations
+
+from functools import partial
+
+from harness import best_of, compare, number, run_samarium
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+# Each size is 10 times the previous one, so it takes at least 10 times as long
+BUDGET = 30
+LOOP = r"""<=collections.{cls};
+c: {cls}();
+i: \;
+.. i < {n} {{
+    c.{push}(i);
+    i+: /;
+}}
+.. i > \ {{
+    c.{pop}();
+    i-: /;
+}}
+"""
+CASES = {
+    "Stack": ("push", "pop"),
+    "Queue": ("put", "get"),
+    "Deque": ("put", "get_front"),
+}
+
+
+def main() -> None:
+    for cls, (push, pop) in CASES.items():
+        timings: list[float] = []
+        for n in SIZES:
+            if timings and timings[-1] * 10 > BUDGET:
+                print(f"{cls} {n:>9,}: skipped")
+                continue
+            code = LOOP.format(cls=cls, n=number(n), push=push, pop=pop)
+            elapsed = best_of(partial(run_samarium, code), 1)
+            timings.append(elapsed)
+            print(f"{cls} {n:>9,}: {elapsed * 1000:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    compare(main)
@@ -0,0 +1,50 @@
+"""Measures how Array set operations scale from 10^3 to 10^6 elements
+
+Both operands hold n distinct numbers and overlap by half. Sizes expected to
+take over a second are timed once, and once an operation takes longer than a
+second its larger sizes are skipped, so revisions with quadratic set
+operations finish too. Pass git revisions as arguments to compare them with
+the working tree.
+"""
+
+# ruff: noqa: INP001
+from __future__ import annotations
+
+import operator
+from functools import partial
+
+from harness import best_of, compare
+from samarium.classes import Array, Num
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+BUDGET = 1
+OPERATIONS = {
+    "|": operator.or_,
+    "&": operator.and_,
+    "--": operator.truediv,
+    "^": operator.xor,
+}
+
+
+def main() -> None:
+    operands = {
+        n: (
+            Array([Num(i) for i in range(n)]),
+            Array([Num(i) for i in range(n // 2, n + n // 2)]),
+        )
+        for n in SIZES
+    }
+    for symbol, op in OPERATIONS.items():
+        elapsed = 0.0
+        for n, (a, b) in operands.items():
+            if elapsed > BUDGET:
+                print(f"{symbol:>2} {n:>9,}: skipped")
+                continue
+            # Every size is 10 times the previous one
+            runs = 1 if elapsed * 10 > BUDGET else 3
+            elapsed = best_of(partial(op, a, b), runs)
+            print(f"{symbol:>2} {n:>9,}: {elapsed * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    compare(main)
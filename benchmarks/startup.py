@@ -0,0 +1,60 @@
+"""Measures interpreter startup with and without importing the standard library
+
+Runs an empty script, a script containing only `<=collections;` and one that
+imports every standard library module, each in a fresh process. Imports are
+measured both from the frozen image and transpiled from source, with the
+on-disk cache bypassed in both cases.
+"""
+
+# ruff: noqa: INP001
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from harness import best_of
+from samarium.cache import FROZEN, STDLIB
+
+RUNS = 20
+ENV = os.environ | {"PYTHONDONTWRITEBYTECODE": "1"}
+# Runs a script with every cache lookup missing, so imports are transpiled
+FROM_SOURCE = """\
+from samarium import cache, main
+cache.load = lambda *_, **__: None
+main()
+"""
+
+
+def measure(*args: str) -> float:
+    command = [sys.executable, *args]
+    return best_of(lambda: subprocess.run(command, env=ENV, check=True), RUNS)
+
+
+def main() -> None:
+    if not FROZEN.exists():
+        print("no frozen image found, run `just freeze` first")
+        return
+    with TemporaryDirectory() as tmp:
+        scripts = {
+            "empty script": "",
+            "<=collections;": "<=collections;",
+            "whole stdlib": "".join(f"<={p.stem};" for p in STDLIB.glob("*.sm")),
+        }
+        timings = {"import samarium": measure("-c", "import samarium")}
+        for name, code in scripts.items():
+            path = Path(tmp, "main.sm")
+            path.write_text(code)
+            if not code:
+                timings[name] = measure("-m", "samarium", str(path))
+                continue
+            timings[f"{name} (frozen)"] = measure("-m", "samarium", str(path))
+            timings[f"{name} (source)"] = measure("-c", FROM_SOURCE, str(path))
+    for name, elapsed in timings.items():
+        print(f"{name:>24}: {elapsed * 1000:>7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
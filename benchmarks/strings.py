@@ -0,0 +1,41 @@
+"""Measures throughput of shifting, repeating and casting 10 MB strings
+
+Strings are measured both as ASCII and as two-byte Cyrillic text, each 10 MB
+when encoded as UTF-8. Pass git revisions as arguments to compare them with
+the working tree.
+"""
+
+# ruff: noqa: INP001
+from __future__ import annotations
+
+import operator
+from functools import partial
+
+from harness import best_of, compare
+from samarium.classes import Num, String
+
+SIZE = 10_000_000
+TEXTS = {
+    "ascii": "samarium" * (SIZE // 8),
+    "cyrillic": "самарий" * (SIZE // 14),
+}
+
+
+def main() -> None:
+    one, one_and_half = Num(1), Num(1.5)
+    for name, text in TEXTS.items():
+        string = String(text)
+        codes = string.cast()
+        cases = {
+            "+ /": partial(operator.add, string, one),
+            "++ /`/": partial(operator.mul, string, one_and_half),
+            "string%": string.cast,
+            "array%": codes.cast,
+        }
+        for operation, func in cases.items():
+            elapsed = best_of(func, 3)
+            print(f"{name:>8} {operation:>8}: {SIZE / elapsed / 1e6:>8.1f} MB/s")
+
+
+if __name__ == "__main__":
+    compare(main)
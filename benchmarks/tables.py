@@ -0,0 +1,38 @@
+"""Measures Table lookup throughput with Number and String keys
+
+Looks up every key of a 100k-entry Table, as an in-memory index would. Pass
+git revisions as arguments to compare them with the working tree.
+"""
+
+# ruff: noqa: INP001
+from __future__ import annotations
+
+from functools import partial
+
+from harness import best_of, compare
+from samarium.classes import Num, String, Table
+
+SIZE = 100_000
+
+
+def lookups(table: Table, keys: list) -> None:
+    for key in keys:
+        table[key]
+
+
+def main() -> None:
+    cases = {
+        "Number keys": [Num(i) for i in range(SIZE)],
+        "large Number keys": [Num(i * 10**9) for i in range(SIZE)],
+        "String keys": [String(f"key{i}") for i in range(SIZE)],
+    }
+    for name, keys in cases.items():
+        table = Table(dict.fromkeys(keys, Num(1)))
+        # Fresh but equal keys, so hashes cached on the stored keys don't help
+        fresh = [type(k)(k.val) for k in keys]
+        elapsed = best_of(partial(lookups, table, fresh))
+        print(f"{name:>18}: {SIZE / elapsed:>12,.0f} lookups/s")
+
+
+if __name__ == "__main__":
+    compare(main)
@@ -0,0 +1,53 @@
+"""Measures tokenizer throughput in tokens per second
+
+Tokenizes the standard library repeated 1, 4 and 16 times. When `crossandra`
+is installed, the crossandra-based tokenizer is measured alongside it.
+"""
+
+# ruff: noqa: INP001
+from __future__ import annotations
+
+import time
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from samarium import tokenizer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+REPEATS = (1, 4, 16)
+
+
+def tokenizers() -> dict[str, Callable[[str], list]]:
+    out = {"tokenizer": lambda code: tokenizer.scan(code)[0]}
+    spec = spec_from_file_location("equivalence", ROOT / "tests/tokenizer.py")
+    equivalence = module_from_spec(spec)
+    try:
+        spec.loader.exec_module(equivalence)
+    except ImportError:
+        return out
+    return {"crossandra": equivalence.crossandra_tokenizer().tokenize, **out}
+
+
+def main() -> None:
+    stdlib = "\n".join(
+        p.read_text() for p in sorted((ROOT / "src/samarium/modules").glob("*.sm"))
+    )
+    candidates = tokenizers()
+    for repeat in REPEATS:
+        code = stdlib * repeat
+        for name, tokenize in candidates.items():
+            start = time.perf_counter()
+            count = len(tokenize(code))
+            elapsed = time.perf_counter() - start
+            print(
+                f"{len(code) // 1000:>5} KB {name:>10}: "
+                f"{count:>7} tokens, {count / elapsed:>12,.0f} tokens/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Measures how transpile time scales with program size
+
+Transpiles synthetic programs of 5k to 80k lines. Functions, generators,
+loops, branches and collection literals are all repeated with fresh names,
+so the time per token should stay flat as the programs grow.
+"""
+
+# ruff: noqa: INP001
+from __future__ import annotations
+
+from functools import partial
+
+from harness import best_of
+from samarium.tokenizer import tokenize_with_lines
+from samarium.transpiler import Registry, Transpiler
+
+# Each block is 15 lines long, with `@` replaced by the block number
+BLOCK = r"""f@ a b * {
+    x: a + b ++ /\;
+    ... i ->? <<../\/>> {
+        ** x + i;
+    }
+}
+g@ a * {
+    * a - / ? a > \ ,, a;
+}
+y@: [/, /\, //];
+? y@ > [/] {
+    z@: {{"k@" -> y@}};
+} ,, {
+    y@+: [f@(/, /\), g@(//)];
+}
+"""
+SIZES = (5_000, 10_000, 20_000, 40_000, 80_000)
+
+
+def transpile(code: str) -> None:
+    tokens, lines = tokenize_with_lines(code)
+    Transpiler(tokens, Registry({}), lines).transpile()
+
+
+def main() -> None:
+    for size in SIZES:
+        code = "".join(BLOCK.replace("@", str(i)) for i in range(size // 15))
+        tokens = len(tokenize_with_lines(code)[0])
+        elapsed = best_of(partial(transpile, code), 3)
+        print(
+            f"{size:>6} lines, {tokens:>9,} tokens: {elapsed:>7.2f} s, "
+            f"{elapsed / tokens * 1e9:>6,.0f} ns/token"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,14 @@ from pathlib import Path
 from samarium.core import run
 from samarium.exceptions import DAHLIA
 from samarium.repl import REPL, Command
+from samarium.runtime import Runtime
 from samarium.transpiler import Registry
 from samarium.utils import __version__
 
 OPTIONS = ("-v", "--version", "-c", "--command", "-h", "--help")
+OPTIMIZE = ("-O", "--optimize")
 
-HELP = """samarium &7[option] [-c cmd | file]&R
+HELP = """samarium &7[-O] [option] [-c cmd | file]&R
 options and arguments:\n""" + "\n".join(
     map(
         str,
@@ -23,6 +25,12 @@ options and arguments:\n""" + "\n".join(
                 msg="reads program from string",
             ),
             Command("-h", "--help", sep=", ", msg="shows this message"),
+            Command(
+                "-O",
+                "--optimize",
+                sep=", ",
+                msg="folds and hoists constants before running",
+            ),
             Command("-v", "--version", sep=", ", msg="prints Samarium version"),
             Command(arg="file", sep=", ", msg=" reads program from script file"),
         ),
@@ -33,6 +41,10 @@ options and arguments:\n""" + "\n".join(
 def main(*, debug: bool = False) -> None:
     reg = Registry(globals())
 
+    if sys.argv[1:2] and sys.argv[1] in OPTIMIZE:
+        Runtime.optimize = True
+        del sys.argv[1]
+
     if len(sys.argv) == 1:
         return REPL(debug=debug).run()
 
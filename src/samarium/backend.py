@@ -0,0 +1,99 @@
+"""Compiles transpiled code, mapping it back to Samarium source lines"""
+
+from __future__ import annotations
+
+import ast
+from copy import deepcopy
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from samarium import optimizer
+
+if TYPE_CHECKING:
+    from types import CodeType
+
+    from samarium.transpiler import Registry
+
+TEMPLATE = (Path(__file__).resolve().parent / "template.txt").read_text()
+HEAD, _, TAIL = TEMPLATE.partition("{{CODE}}")
+
+
+@cache
+def _template() -> tuple[list[ast.stmt], list[ast.stmt]]:
+    return ast.parse(HEAD).body, ast.parse(TAIL).body
+
+
+def _head(source: str) -> list[ast.stmt]:
+    head = deepcopy(_template()[0])
+    for stmt in head:
+        for node in ast.walk(stmt):
+            if isinstance(node, ast.Constant) and node.value == "{{SOURCE}}":
+                node.value = source
+    return head
+
+
+def source_line(reg: Registry, lineno: int) -> int:
+    """Maps a line of the transpiled output to its Samarium source line"""
+    if 0 < lineno <= len(reg.lines):
+        return reg.lines[lineno - 1]
+    return lineno
+
+
+def _map_lines(tree: ast.AST, reg: Registry) -> None:
+    for node in ast.walk(tree):
+        if (lineno := getattr(node, "lineno", None)) is None:
+            continue
+        node.lineno = source_line(reg, lineno)
+        if (end_lineno := node.end_lineno) is None:
+            continue
+        node.end_lineno = source_line(reg, end_lineno)
+        # Nodes spanning several output lines can collapse onto a single
+        # source line, where their columns would no longer be ordered
+        if end_lineno != lineno and node.end_lineno <= node.lineno:
+            node.end_lineno = node.lineno
+            node.end_col_offset = max(node.end_col_offset, node.col_offset)
+
+
+def parse(reg: Registry) -> ast.Module:
+    """Parses the output of a transpiled registry, with Samarium line numbers"""
+    try:
+        tree = ast.parse(reg.output)
+    except SyntaxError as e:
+        if e.lineno is not None:
+            e.lineno = source_line(reg, e.lineno)
+        raise
+    _map_lines(tree, reg)
+    return tree
+
+
+def build(tree: ast.Module, source: str) -> ast.Module:
+    """Wraps a parsed module in the script template"""
+    return ast.Module([*_head(source), *tree.body, *_template()[1]], type_ignores=[])
+
+
+def to_ast(reg: Registry, source: str | None, *, optimize: bool) -> ast.Module:
+    tree = parse(reg)
+    if optimize:
+        tree = optimizer.optimize(tree)
+    return tree if source is None else build(tree, source)
+
+
+def compile_output(
+    reg: Registry, source: str | None, *, optimize: bool = False
+) -> CodeType:
+    """Compiles a transpiled registry, wrapped in the template if given a source"""
+    if optimize:
+        return compile(to_ast(reg, source, optimize=True), "<string>", "exec")
+    # Compiling straight from text is several times faster than building the
+    # AST in Python first, so the AST is only built when something needs it
+    src, offset = reg.output, 0
+    if source is not None:
+        src = HEAD.replace("{{SOURCE}}", source) + src + TAIL
+        offset = HEAD.count("\n")
+    try:
+        return compile(src, "<string>", "exec")
+    except SyntaxError as e:
+        if e.lineno is not None:
+            e.lineno = source_line(reg, e.lineno - offset)
+        raise
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import marshal
+import os
+import sys
+from contextlib import suppress
+from functools import cache
+from hashlib import sha256
+from importlib.util import MAGIC_NUMBER
+from pathlib import Path
+from types import CodeType
+
+from samarium.backend import TEMPLATE
+from samarium.utils import __version__
+
+CACHE_DIR = "__smcache__"
+PACKAGE = Path(__file__).resolve().parent
+STDLIB = PACKAGE / "modules"
+FROZEN = STDLIB / f"stdlib.{sys.implementation.cache_tag}.frozen"
+
+# Cached code is only valid for the compiler that produced it, so any change
+# to the pipeline's sources (even without a version bump) invalidates it
+COMPILER = ("tokens.py", "tokenizer.py", "transpiler.py", "optimizer.py", "backend.py")
+
+
+def compiler_hash() -> bytes:
+    digest = sha256()
+    for name in COMPILER:
+        digest.update((PACKAGE / name).read_bytes())
+    return digest.digest()
+
+
+_SALT = b"\0".join(
+    (__version__.encode(), MAGIC_NUMBER, TEMPLATE.encode(), compiler_hash())
+)
+
+
+def cache_key(code: str, source: str, *, optimize: bool = False) -> bytes:
+    data = (_SALT, b"O" * optimize, source.encode(), code.encode())
+    return sha256(b"\0".join(data)).digest()
+
+
+def cache_path(source: Path, *, optimize: bool = False) -> Path:
+    # Optimized code is cached separately, so switching -O on and off
+    # doesn't invalidate either version
+    suffix = ".opt.smc" if optimize else ".smc"
+    return source.parent / CACHE_DIR / f"{source.stem}{suffix}"
+
+
+def frozen_name(stem: str, *, optimize: bool = False) -> str:
+    return f"{stem}.opt" if optimize else stem
+
+
+@cache
+def frozen_modules() -> dict[str, tuple[bytes, CodeType]]:
+    try:
+        image = marshal.loads(FROZEN.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return {}
+    return image if isinstance(image, dict) else {}
+
+
+def load_frozen(code: str, source: Path, *, optimize: bool) -> CodeType | None:
+    name = frozen_name(source.stem, optimize=optimize)
+    if source.parent != STDLIB or name not in frozen_modules():
+        return None
+    key, bytecode = frozen_modules()[name]
+    if key != cache_key(code, source.stem, optimize=optimize):
+        return None
+    # Frozen modules are compiled with the placeholder left in for `__file__`
+    consts = tuple(str(source) if c == "{{SOURCE}}" else c for c in bytecode.co_consts)
+    return bytecode.replace(co_consts=consts)
+
+
+def load(code: str, source: Path, *, optimize: bool = False) -> CodeType | None:
+    """Returns the cached code object for `source`, or None if it's stale"""
+    if (bytecode := load_frozen(code, source, optimize=optimize)) is not None:
+        return bytecode
+    key = cache_key(code, str(source), optimize=optimize)
+    try:
+        data = cache_path(source, optimize=optimize).read_bytes()
+    except OSError:
+        return None
+    if data[: len(key)] != key:
+        return None
+    try:
+        bytecode = marshal.loads(data[len(key) :])
+    except (EOFError, ValueError, TypeError):
+        return None
+    return bytecode if isinstance(bytecode, CodeType) else None
+
+
+def store(
+    code: str, source: Path, bytecode: CodeType, *, optimize: bool = False
+) -> None:
+    if sys.dont_write_bytecode:
+        return
+    path = cache_path(source, optimize=optimize)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    data = cache_key(code, str(source), optimize=optimize) + marshal.dumps(bytecode)
+    # The cache is an optimization, an unwritable directory shouldn't break a run
+    with suppress(OSError):
+        path.parent.mkdir(exist_ok=True)
+        tmp.write_bytes(data)
+        tmp.replace(path)
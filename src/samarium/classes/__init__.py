@@ -6,37 +6,52 @@ from samarium.classes.base import (
     NULL,
     Array,
     Attrs,
+    Bytes,
     Dataclass,
+    Deque,
     Enum,
     Function,
     Iterator,
     Module,
     Null,
     Num,
+    NumArray,
     Number,
+    Queue,
     Slice,
+    Stack,
     String,
+    StringBuilder,
     Table,
     Type,
     UserAttrs,
     Zip,
+    add_in_place,
     correct_type,
+    subtract_in_place,
+    union_in_place,
 )
 from samarium.classes.fileio import File, FileManager, Mode
 
 __all__ = (
     "Array",
     "Attrs",
+    "Bytes",
     "Dataclass",
+    "Deque",
     "Enum",
     "File",
     "Function",
     "Iterator",
     "Slice",
+    "Stack",
     "Table",
     "Number",
     "Num",
+    "NumArray",
+    "Queue",
     "String",
+    "StringBuilder",
     "Module",
     "Type",
     "MISSING",
@@ -47,5 +62,8 @@ __all__ = (
     "Mode",
     "UserAttrs",
     "Zip",
+    "add_in_place",
     "correct_type",
+    "subtract_in_place",
+    "union_in_place",
 )
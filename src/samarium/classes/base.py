@@ -1,17 +1,23 @@
 from __future__ import annotations
 
+import math
+import operator
 import re
-from collections.abc import Callable, Iterable, Mapping
+import sys
+from array import array
+from collections import Counter, deque
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from collections.abc import Iterator as PyIterator
 from contextlib import suppress
-from functools import lru_cache
 from inspect import signature
+from itertools import compress, count, repeat
 from random import choice, randrange, uniform
 from types import GeneratorType, MethodType
 from typing import Any, Generic, TypeVar, cast
 
 from samarium.exceptions import (
     NotDefinedError,
+    SamariumError,
     SamariumSyntaxError,
     SamariumTypeError,
     SamariumValueError,
@@ -40,17 +46,26 @@ def functype_repr(obj: Any) -> str:
     )
 
 
+def quoted(obj: Any) -> str:
+    return f'"{obj}"' if type(obj) is String else str(obj)
+
+
+def coerce(self: Any, other: Any, operator: str, default: int | None = None) -> Any:
+    """Returns the operand to use in place of `other` for a guarded operation"""
+    if isinstance(other, type(self)):
+        return other
+    if default is not None and other.val is None:
+        return Num(default)
+    msg = f"{type(self).__name__} {operator} {type(other).__name__}"
+    raise NotDefinedError(msg)
+
+
 def guard(operator: str, *, default: int | None = None) -> Callable[..., Any]:
     def decorator(function: Callable[..., Any]) -> Callable[..., Any]:
         def wrapper(self: Any, other: Any) -> Any:
-            cls = type(self)
-            use_default = default is not None and other.val is None
-            if isinstance(other, cls):
+            if isinstance(other, type(self)):
                 return function(self, other)
-            if use_default:
-                return function(self, Num(default))
-            msg = f"{cls.__name__} {operator} {type(other).__name__}"
-            raise NotDefinedError(msg)
+            return function(self, coerce(self, other, operator, default))
 
         return wrapper
 
@@ -101,12 +116,6 @@ class CompositionMeta(type):
 
 
 class Attrs(metaclass=CompositionMeta):
-    def __getattribute__(self, name: str) -> Any:
-        attr = object.__getattribute__(self, name)
-        if isinstance(attr, Function) and "self" in signature(attr.func).parameters:
-            return Function(attr.func, self)
-        return attr
-
     @classmethod
     def id(cls) -> String:
         return String(f"{id(cls):x}")
@@ -114,6 +123,9 @@ class Attrs(metaclass=CompositionMeta):
     def __repr__(self) -> str:
         return str(self)
 
+    def _eq(self, other: object) -> bool:
+        return self is other or bool(self == other)
+
     @classmethod
     def type(cls) -> Type:
         return Type(cls)
@@ -265,12 +277,12 @@ class Dataclass(UserAttrs):
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, type(self)):
-            return self.vals == other.vals
+            return all(map(equals, self.vals, other.vals))
         return False
 
     def __gt__(self, other: object) -> bool:
         if isinstance(other, type(self)):
-            return self.vals > other.vals
+            return compare(self.vals, other.vals, operator.gt)
         return False
 
     def __ne__(self, other: object) -> bool:
@@ -390,12 +402,14 @@ class Number(Attrs):
 
     __repr__ = __str__
 
-    @guard("+", default=1)
     def __add__(self, other: Any) -> Number:
+        if type(other) is not Number:
+            other = coerce(self, other, "+", 1)
         return Num(self.val + other.val)
 
-    @guard("-", default=1)
     def __sub__(self, other: Any) -> Number:
+        if type(other) is not Number:
+            other = coerce(self, other, "-", 1)
         return Num(self.val - other.val)
 
     def __mul__(self, other: Any) -> String | Number:
@@ -405,34 +419,40 @@ class Number(Attrs):
             other = Num(2)
         return Num(self.val * other.val)
 
-    @guard("--", default=2)
     def __truediv__(self, other: Any) -> Number:
+        if type(other) is not Number:
+            other = coerce(self, other, "--", 2)
         return Num(self.val / other.val)
 
-    @guard("+++", default=2)
     def __pow__(self, other: Any) -> Number:
+        if type(other) is not Number:
+            other = coerce(self, other, "+++", 2)
         return Num(self.val**other.val)
 
-    @guard("---", default=2)
     def __mod__(self, other: Any) -> Number:
+        if type(other) is not Number:
+            other = coerce(self, other, "---", 2)
         return Num(self.val % other.val)
 
-    @guard("&")
     def __and__(self, other: Any) -> Number:
+        if type(other) is not Number:
+            other = coerce(self, other, "&")
         if self.is_int and other.is_int:
             return Num(self.val & other.val)
         msg = "cannot use & with non-integer numbers"
         raise SamariumValueError(msg)
 
-    @guard("|")
     def __or__(self, other: Any) -> Number:
+        if type(other) is not Number:
+            other = coerce(self, other, "|")
         if self.is_int and other.is_int:
             return Num(self.val | other.val)
         msg = "cannot use | with non-integer numbers"
         raise SamariumValueError(msg)
 
-    @guard("^")
     def __xor__(self, other: Any) -> Number:
+        if type(other) is not Number:
+            other = coerce(self, other, "^")
         if self.is_int and other.is_int:
             return Num(self.val ^ other.val)
         msg = "cannot use ^ with non-integer numbers"
@@ -450,34 +470,41 @@ class Number(Attrs):
     def __neg__(self) -> Number:
         return Num(-self.val)
 
+    def _eq(self, other: object) -> bool:
+        return isinstance(other, Number) and self.val == other.val
+
     def __eq__(self, other: object) -> Number:
         if isinstance(other, Number):
             return Num(self.val == other.val)
-        return Num(0.0)
+        return Num(0)
 
     def __ne__(self, other: object) -> Number:
         if isinstance(other, Number):
             return Num(self.val != other.val)
-        return Num(1.0)
+        return Num(1)
 
-    @guard(">", default=0)
     def __gt__(self, other: Any) -> Number:
+        if type(other) is not Number:
+            other = coerce(self, other, ">", 0)
         return Num(self.val > other.val)
 
-    @guard(">:", default=0)
     def __ge__(self, other: Any) -> Number:
+        if type(other) is not Number:
+            other = coerce(self, other, ">:", 0)
         return Num(self.val >= other.val)
 
-    @guard("<", default=0)
     def __lt__(self, other: Any) -> Number:
+        if type(other) is not Number:
+            other = coerce(self, other, "<", 0)
         return Num(self.val < other.val)
 
-    @guard("<:", default=0)
     def __le__(self, other: Any) -> Number:
+        if type(other) is not Number:
+            other = coerce(self, other, "<:", 0)
         return Num(self.val <= other.val)
 
     def __hash__(self) -> int:
-        return cast(int, self.hash().val)
+        return hash(self.val)
 
     def cast(self) -> String:
         if self.is_int:
@@ -503,7 +530,35 @@ class Number(Attrs):
         return Number(int(self.val))
 
 
-Num = lru_cache(1024)(Number)
+# Small integers are interned on first use, which covers loop counters and
+# indices, other numbers are built directly
+SMALL_INT_MIN = -256
+SMALL_INT_MAX = 65536
+
+
+class NumberTable(dict[Any, Number]):
+    def __missing__(self, v: Any) -> Number:
+        # Arithmetic results skip Number.__init__'s conversions
+        t = type(v)
+        if t is int:
+            number = object.__new__(Number)
+            number.val = v
+            number.is_int = True
+            if SMALL_INT_MIN <= v < SMALL_INT_MAX:
+                self[v] = number
+            return number
+        if t is bool:
+            return self[int(v)]
+        if t is float and not v.is_integer():
+            number = object.__new__(Number)
+            number.val = v
+            number.is_int = False
+            return number
+        return Number(v)
+
+
+# Looking a number up is a single C-level dict access when it's interned
+Num = NumberTable().__getitem__
 
 
 class String(Attrs):
@@ -537,17 +592,22 @@ class String(Attrs):
             other = Num(1)
         if isinstance(other, Number):
             if other.is_int:
-                return String(
-                    "".join(
-                        chr((ord(i) + cast(int, other.val)) % 0x10FFFF)
-                        for i in self.val
-                    )
-                )
+                return String(shift(self.val, cast(int, other.val)))
             msg = "cannot shift using non-integers"
             raise SamariumTypeError(msg)
         msg = f"String + {get_type_name(other)}"
         raise SamariumTypeError(msg)
 
+    def _iadd(self, other: object) -> String:
+        if not isinstance(other, String):
+            return self + other
+        # With its only reference held by a local, CPython resizes the str in
+        # place instead of copying it, so repeated appends are amortized
+        val, self.val = self.val, ""
+        val += other.val
+        self.val = val
+        return self
+
     def __sub__(self, other: object) -> String:
         if isinstance(other, String):
             return String(self.val.replace(other.val, "", 1))
@@ -581,6 +641,9 @@ class String(Attrs):
         msg = f"String --- {get_type_name(other)}"
         raise NotDefinedError(msg)
 
+    def _eq(self, other: object) -> bool:
+        return isinstance(other, String) and self.val == other.val
+
     def __eq__(self, other: object) -> Number:
         return Num(self.val == other.val)
 
@@ -631,7 +694,7 @@ class String(Attrs):
         self.val = "".join(string)
 
     def __hash__(self) -> int:
-        return cast(int, self.hash().val)
+        return hash(self.val)
 
     def __matmul__(self, other: object) -> Zip:
         return Zip(self, other)
@@ -639,7 +702,8 @@ class String(Attrs):
     def cast(self) -> Array | Number:
         if len(self.val) == 1:
             return Num(ord(self.val))
-        return Array(Num(ord(i)) for i in self.val)
+        codes = self.val.encode() if self.val.isascii() else map(ord, self.val)
+        return Array(map(Num, codes))
 
     def hash(self) -> Number:
         return Num(hash(self.val))
@@ -651,6 +715,151 @@ class String(Attrs):
         return Num(len(self.val))
 
 
+class StringBuilder(Attrs):
+    __slots__ = ("val",)
+
+    def __init__(self, value: String | StringBuilder | None = None) -> None:
+        self.val = [] if value is None else to_chars(value)
+
+    def __str__(self) -> str:
+        return "".join(self.val)
+
+    def __bool__(self) -> bool:
+        return bool(self.val)
+
+    def __iter__(self) -> PyIterator[String]:
+        return map(String, self.val)
+
+    def __contains__(self, element: String) -> bool:
+        return element.val in str(self)
+
+    def __iadd__(self, other: String | StringBuilder) -> StringBuilder:
+        if type(other) is String:
+            self.val.extend(other.val)
+        else:
+            self.val += to_chars(other)
+        return self
+
+    def _eq(self, other: object) -> bool:
+        return isinstance(other, StringBuilder) and self.val == other.val
+
+    def __eq__(self, other: object) -> Number:
+        return Num(self._eq(other))
+
+    def __ne__(self, other: object) -> Number:
+        return Num(not self._eq(other))
+
+    def __getitem__(self, index: Number | Slice) -> String:
+        if isinstance(index, Number):
+            if not is_valid_index(self, index):
+                msg = f"invalid index: {index}"
+                raise SamariumTypeError(msg)
+            return String(self.val[cast(int, index.val)])
+        if isinstance(index, Slice):
+            return String("".join(self.val[index.val]))
+        msg = f"invalid index: {index}"
+        raise SamariumTypeError(msg)
+
+    def __setitem__(self, index: Number | Slice, value: String) -> None:
+        if isinstance(index, Slice):
+            chars = to_chars(value)
+            check_slice_size(self, index, len(chars), "characters")
+            self.val[index.val] = chars
+            return
+        if not (isinstance(index, Number) and is_valid_index(self, index)):
+            msg = f"invalid index: {index}"
+            raise SamariumTypeError(msg)
+        if not (isinstance(value, String) and len(value.val) == 1):
+            msg = "can only assign a single character to an index"
+            raise SamariumTypeError(msg)
+        self.val[cast(int, index.val)] = value.val
+
+    def special(self) -> Number:
+        return Num(len(self.val))
+
+
+class Bytes(Attrs):
+    __slots__ = ("val",)
+
+    def __init__(self, value: object = None) -> None:
+        self.val: bytes | bytearray | memoryview
+        if value is None:
+            self.val = bytearray()
+        elif isinstance(value, bytes):
+            # Immutable, so it can be shared until the first in-place change
+            self.val = value
+        else:
+            self.val = bytearray(to_buffer(value))
+
+    def __str__(self) -> str:
+        return self.val.hex(" ")
+
+    def __bool__(self) -> bool:
+        return bool(self.val)
+
+    def __iter__(self) -> PyIterator[Number]:
+        return map(Num, self.val)
+
+    def __contains__(self, element: object) -> bool:
+        if isinstance(element, Number):
+            return element.is_int and 0 <= element.val < 256 and element.val in self.val
+        return to_buffer(element) in bytes(self.val)
+
+    def __add__(self, other: object) -> Bytes:
+        out = Bytes()
+        out.val = bytearray(self.val)
+        out.val += to_buffer(other)
+        return out
+
+    def __iadd__(self, other: object) -> Bytes:
+        data = to_buffer(other)
+        if not isinstance(self.val, bytearray):
+            self.val = bytearray(self.val)
+        try:
+            self.val += data
+        except BufferError:
+            # Slices still view the buffer, which then can't be resized
+            self.val = self.val + data
+        return self
+
+    def _eq(self, other: object) -> bool:
+        return isinstance(other, Bytes) and self.val == other.val
+
+    def __eq__(self, other: object) -> Number:
+        return Num(self._eq(other))
+
+    def __ne__(self, other: object) -> Number:
+        return Num(not self._eq(other))
+
+    def __getitem__(self, index: object) -> Number | Bytes:
+        if isinstance(index, Number):
+            if not is_valid_index(self, index):
+                msg = f"invalid index: {index}"
+                raise SamariumValueError(msg)
+            return Num(self.val[cast(int, index.val)])
+        if isinstance(index, Slice):
+            out = Bytes()
+            out.val = memoryview(self.val)[index.val]
+            return out
+        msg = f"invalid index: {index}"
+        raise SamariumTypeError(msg)
+
+    def special(self) -> Number:
+        return Num(len(self.val))
+
+    def cast(self) -> String:
+        try:
+            return String(str(self.val, "utf-8"))
+        except UnicodeDecodeError:
+            msg = "cannot decode Bytes as UTF-8"
+            raise SamariumValueError(msg) from None
+
+    def sm_export(self) -> Array:
+        return Array(self)
+
+    sm_export_string = cast
+
+
 class Array(Generic[T], Attrs):
     __slots__ = ("val",)
 
@@ -687,33 +896,34 @@ class Array(Generic[T], Attrs):
         yield from self.val
 
     def __contains__(self, element: T) -> bool:
-        return element in self.val
+        return contains(self.val, element)
+
+    def _eq(self, other: object) -> bool:
+        if not isinstance(other, Array) or len(self.val) != len(other.val):
+            return False
+        return all(map(equals, self.val, other.val))
 
     def __eq__(self, other: object) -> Number:
-        if isinstance(other, Array):
-            return Num(self.val == other.val)
-        return Num(0)
+        return Num(self._eq(other))
 
     def __ne__(self, other: object) -> Number:
-        if isinstance(other, Array):
-            return Num(self.val != other.val)
-        return Num(1)
+        return Num(not self._eq(other))
 
     @guard(">")
     def __gt__(self, other: Any) -> Number:
-        return Num(self.val > other.val)
+        return Num(compare(self.val, other.val, operator.gt))
 
     @guard(">:")
     def __ge__(self, other: Any) -> Number:
-        return Num(self.val >= other.val)
+        return Num(compare(self.val, other.val, operator.ge))
 
     @guard("<")
     def __lt__(self, other: Any) -> Number:
-        return Num(self.val < other.val)
+        return Num(compare(self.val, other.val, operator.lt))
 
     @guard("<:")
     def __le__(self, other: Any) -> Number:
-        return Num(self.val <= other.val)
+        return Num(compare(self.val, other.val, operator.le))
 
     def __getitem__(self, index: object) -> T | Array[T]:
         if isinstance(index, Number):
@@ -736,22 +946,25 @@ class Array(Generic[T], Attrs):
                 raise SamariumValueError(msg)
             self.val[cast(int, index.val)] = value
         else:
+            if isinstance(value, Array):
+                check_slice_size(self, index, len(value.val), "elements")
             self.val[index.val] = cast(Array[T], value)
 
     @guard("+")
     def __add__(self, other: Any) -> Array[T]:
         return Array(self.val + other.val)
 
+    def _iadd(self, other: object) -> Attrs:
+        if not isinstance(other, Array):
+            return correct_type(self + other)
+        self.val.extend(map(correct_type, other.val))
+        return self
+
     def __sub__(self, other: object) -> Array[T]:
-        new_array = self.val.copy()
         if isinstance(other, Array):
-            for i in other:
-                try:
-                    new_array.remove(i)
-                except ValueError:
-                    msg = f"{i!r} not in array"
-                    raise SamariumValueError(msg) from None
-        elif isinstance(other, Number):
+            return Array(without(self.val, other.val, strict=True))
+        new_array = self.val.copy()
+        if isinstance(other, Number):
             if not other.is_int:
                 msg = f"invalid index: {other}"
                 raise SamariumValueError(msg)
@@ -763,15 +976,20 @@ class Array(Generic[T], Attrs):
             raise NotDefinedError(msg)
         return Array(new_array)
 
+    def _isub(self, other: object) -> Attrs:
+        if isinstance(other, Array):
+            self.val = without(self.val, other.val, strict=True)
+        elif isinstance(other, Number) and other.is_int:
+            self.val.pop(cast(int, other.val))
+        else:
+            return correct_type(self - other)
+        return self
+
     def __neg__(self) -> Array[T]:
-        new_array = []
-        for i in self.val:
-            if i not in new_array:
-                new_array.append(i)
-        return Array(new_array)
+        return Array(union([], self.val))
 
     def __mod__(self, other: object) -> Array[T]:
-        indexes = [i for i, v in enumerate(self.val) if v == other]
+        indexes = [*compress(count(), map(equal_to(other), self.val))]
         new_array = self.val.copy()
         for i in indexes[1:][::-1]:
             new_array.pop(i)
@@ -779,23 +997,23 @@ class Array(Generic[T], Attrs):
 
     @guard("--")
     def __truediv__(self, other: Any) -> Array[T]:
-        new_array = self.val.copy()
-        for i in other.val:
-            with suppress(ValueError):
-                new_array.remove(i)
-        return Array(new_array)
+        return Array(without(self.val, other.val))
 
     @guard("|")
     def __or__(self, other: Any) -> Array[T]:
-        new_array = self.val.copy()
-        for i in other.val:
-            if i not in new_array:
-                new_array.append(i)
-        return Array(new_array)
+        return Array(union(self.val, other.val))
+
+    def _ior(self, other: object) -> Attrs:
+        if not isinstance(other, Array):
+            return correct_type(self | other)
+        size = len(self.val)
+        self.val = union(self.val, other.val)
+        self.val[size:] = map(correct_type, self.val[size:])
+        return self
 
     @guard("&")
     def __and__(self, other: Any) -> Array[T]:
-        return Array([i for i in other.val if i in self.val])
+        return Array(intersection(self.val, other.val))
 
     @guard("^")
     def __xor__(self, other: Any) -> Array[T]:
@@ -812,6 +1030,11 @@ class Array(Generic[T], Attrs):
         return Zip(self, other)
 
     def cast(self) -> String:
+        if CODE_UNIT is not None and set(map(type, self.val)) <= {Number}:
+            with suppress(TypeError, ValueError, OverflowError):
+                codes = array(CODE_UNIT, map(operator.attrgetter("val"), self.val))
+                return String(codes.tobytes().decode(UTF32, "surrogatepass"))
+        # Finds the element to blame
         s = ""
         for i in self.val:
             if isinstance(i, Number) and i.is_int:
@@ -831,6 +1054,323 @@ class Array(Generic[T], Attrs):
         return Num(len(self.val))
 
 
+class NumArray(Attrs):
+    __slots__ = ("val",)
+
+    def __init__(self, value: object = None) -> None:
+        self.val: array | list[int | float]
+        if value is None:
+            self.val = array("q")
+        elif isinstance(value, NumArray):
+            self.val = value.val[:]
+        else:
+            if not isinstance(value, Array):
+                value = Array(value)
+            if not set(map(type, value.val)) <= {Number}:
+                msg = "NumArray can only contain numbers"
+                raise SamariumTypeError(msg)
+            self.val = pack(map(operator.attrgetter("val"), value.val))
+
+    def __str__(self) -> str:
+        return f"[{', '.join(map(str, self))}]"
+
+    def __bool__(self) -> bool:
+        return bool(self.val)
+
+    def __iter__(self) -> PyIterator[Number]:
+        return map(Num, self.val)
+
+    def __contains__(self, element: object) -> bool:
+        return isinstance(element, Number) and element.val in self.val
+
+    def _apply(
+        self, op: Callable[[Any, Any], Any], other: object, operator: str
+    ) -> NumArray:
+        if isinstance(other, Number):
+            return to_numarray(map(op, self.val, repeat(other.val)))
+        if isinstance(other, NumArray):
+            if len(self.val) != len(other.val):
+                msg = f"NumArray lengths differ: {len(self.val)} and {len(other.val)}"
+                raise SamariumValueError(msg)
+            return to_numarray(map(op, self.val, other.val))
+        msg = f"NumArray {operator} {get_type_name(other)}"
+        raise NotDefinedError(msg)
+
+    def _apply_bitwise(
+        self, op: Callable[[Any, Any], Any], other: object, operator: str
+    ) -> NumArray:
+        if isinstance(other, NumArray | Number):
+            ints = NumArray()
+            ints.val = integers(self.val, operator)
+            if isinstance(other, NumArray):
+                other_ints = NumArray()
+                other_ints.val = integers(other.val, operator)
+                other = other_ints
+            elif not other.is_int:
+                integers([other.val], operator)
+            return ints._apply(op, other, operator)
+        msg = f"NumArray {operator} {get_type_name(other)}"
+        raise NotDefinedError(msg)
+
+    def __add__(self, other: object) -> NumArray:
+        return self._apply(operator.add, other, "+")
+
+    def __sub__(self, other: object) -> NumArray:
+        return self._apply(operator.sub, other, "-")
+
+    def __mul__(self, other: object) -> NumArray:
+        return self._apply(operator.mul, other, "++")
+
+    def __truediv__(self, other: object) -> NumArray:
+        return self._apply(operator.truediv, other, "--")
+
+    def __pow__(self, other: object) -> NumArray:
+        return self._apply(operator.pow, other, "+++")
+
+    def __mod__(self, other: object) -> NumArray:
+        return self._apply(operator.mod, other, "---")
+
+    def __and__(self, other: object) -> NumArray:
+        return self._apply_bitwise(operator.and_, other, "&")
+
+    def __or__(self, other: object) -> NumArray:
+        return self._apply_bitwise(operator.or_, other, "|")
+
+    def __xor__(self, other: object) -> NumArray:
+        return self._apply_bitwise(operator.xor, other, "^")
+
+    def __eq__(self, other: object) -> NumArray:  # type: ignore[override]
+        return self._apply(operator.eq, other, "::")
+
+    def __ne__(self, other: object) -> NumArray:  # type: ignore[override]
+        return self._apply(operator.ne, other, ":::")
+
+    def __gt__(self, other: object) -> NumArray:
+        return self._apply(operator.gt, other, ">")
+
+    def __ge__(self, other: object) -> NumArray:
+        return self._apply(operator.ge, other, ">:")
+
+    def __lt__(self, other: object) -> NumArray:
+        return self._apply(operator.lt, other, "<")
+
+    def __le__(self, other: object) -> NumArray:
+        return self._apply(operator.le, other, "<:")
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def _eq(self, other: object) -> bool:
+        return isinstance(other, NumArray) and self.val == other.val
+
+    def __neg__(self) -> NumArray:
+        return to_numarray(map(operator.neg, self.val))
+
+    def __pos__(self) -> NumArray:
+        return self
+
+    def __invert__(self) -> NumArray:
+        return to_numarray(map(operator.invert, integers(self.val, "~")))
+
+    def __getitem__(self, index: object) -> Number | NumArray:
+        if isinstance(index, Number):
+            if not is_valid_index(self, index):
+                msg = f"invalid index: {index}"
+                raise SamariumValueError(msg)
+            return Num(self.val[cast(int, index.val)])
+        if isinstance(index, Slice):
+            out = NumArray()
+            out.val = self.val[index.val]
+            return out
+        msg = f"invalid index: {index}"
+        raise SamariumTypeError(msg)
+
+    def __setitem__(self, index: object, value: object) -> None:
+        i: int | slice
+        new: Any
+        if isinstance(index, Number):
+            if not is_valid_index(self, index):
+                msg = f"invalid index: {index}"
+                raise SamariumValueError(msg)
+            if not isinstance(value, Number):
+                msg = "NumArray can only contain numbers"
+                raise SamariumTypeError(msg)
+            i, new = cast(int, index.val), value.val
+        elif isinstance(index, Slice):
+            i, new = index.val, NumArray(value).val
+        else:
+            msg = f"invalid index: {index}"
+            raise SamariumTypeError(msg)
+        try:
+            self.val[i] = new
+        except (TypeError, OverflowError):
+            # The value doesn't fit the current storage
+            values = list(self.val)
+            values[i] = new
+            self.val = pack(values)
+
+    def special(self) -> Number:
+        return Num(len(self.val))
+
+    def sm_sum(self) -> Number:
+        return Num(sum(self.val))
+
+    def sm_product(self) -> Number:
+        return Num(math.prod(self.val))
+
+    def sm_min(self) -> Number:
+        if not self.val:
+            msg = "empty NumArray has no minimum"
+            raise SamariumValueError(msg)
+        return Num(min(self.val))
+
+    def sm_max(self) -> Number:
+        if not self.val:
+            msg = "empty NumArray has no maximum"
+            raise SamariumValueError(msg)
+        return Num(max(self.val))
+
+
+class BoundedCollection(Attrs):
+    __slots__ = ("sm_size", "val")
+    name = "collection"
+
+    def __init__(self, size: Number | None = None) -> None:
+        self.val: deque[Any] = deque()
+        self.sm_size = Num(-1) if size is None else size
+
+    def __bool__(self) -> bool:
+        return bool(self.val)
+
+    def special(self) -> Number:
+        return Num(len(self.val))
+
+    def sm_is_empty(self) -> Number:
+        return Num(not self.val)
+
+    def sm_is_full(self) -> Number:
+        return Num(len(self.val) == self.sm_size.val)
+
+    def _throw_empty(self) -> None:
+        if not self.val:
+            msg = f"{self.name} is empty"
+            raise SamariumError(msg)
+
+    def _throw_full(self) -> None:
+        if len(self.val) == self.sm_size.val:
+            msg = f"{self.name} is full (size {self.sm_size})"
+            raise SamariumError(msg)
+
+    def _items_str(self) -> str:
+        if len(self.val) <= 5:
+            return ", ".join(map(functype_repr, self.val))
+        return f"{quoted(self.val[0])}, ..., {quoted(self.val[-1])}"
+
+
+class Deque(BoundedCollection):
+    __slots__ = ()
+    name = "deque"
+
+    def __str__(self) -> str:
+        return f"Deque({self._items_str()})"
+
+    sm_throw_empty = BoundedCollection._throw_empty
+    sm_throw_full = BoundedCollection._throw_full
+
+    def sm_put(self, item: Any) -> None:
+        self._throw_full()
+        self.val.append(correct_type(item))
+
+    def sm_put_front(self, item: Any) -> None:
+        self._throw_full()
+        self.val.appendleft(correct_type(item))
+
+    def sm_put_all(self, items: Iterable[Any]) -> None:
+        for item in items:
+            self.sm_put(item)
+
+    def sm_put_front_all(self, items: Iterable[Any]) -> None:
+        for item in items:
+            self.sm_put_front(item)
+
+    def sm_front(self) -> Any:
+        if not self.val:
+            msg = "invalid index: 0"
+            raise SamariumValueError(msg)
+        return correct_type(self.val[0])
+
+    def sm_back(self) -> Any:
+        if not self.val:
+            msg = "invalid index: -1"
+            raise SamariumValueError(msg)
+        return correct_type(self.val[-1])
+
+    def sm_get(self) -> Any:
+        self._throw_empty()
+        return self.val.pop()
+
+    def sm_get_front(self) -> Any:
+        self._throw_empty()
+        return self.val.popleft()
+
+
+class Queue(BoundedCollection):
+    __slots__ = ()
+    name = "queue"
+
+    def __str__(self) -> str:
+        return f"Queue({self._items_str()})"
+
+    def __contains__(self, element: object) -> bool:
+        return contains(self.val, element)
+
+    sm_throw_empty = BoundedCollection._throw_empty
+
+    def sm_put(self, item: Any) -> None:
+        self._throw_full()
+        self.val.append(correct_type(item))
+
+    def sm_put_all(self, items: Iterable[Any]) -> None:
+        for item in items:
+            self.sm_put(item)
+
+    def sm_get(self) -> Any:
+        self._throw_empty()
+        return self.val.popleft()
+
+    def sm_first(self) -> Any:
+        self._throw_empty()
+        return correct_type(self.val[0])
+
+    def sm_last(self) -> Any:
+        self._throw_empty()
+        return correct_type(self.val[-1])
+
+
+class Stack(BoundedCollection):
+    __slots__ = ()
+    name = "stack"
+
+    def __str__(self) -> str:
+        top = quoted(self.val[-1]) if self.val else NULL
+        return f"Stack(capacity:{self.sm_size}, size:{len(self.val)}, top:{top})"
+
+    def sm_push(self, item: Any) -> None:
+        self._throw_full()
+        self.val.append(correct_type(item))
+
+    def sm_push_all(self, items: Iterable[Any]) -> None:
+        for item in items:
+            self.sm_push(item)
+
+    def sm_pop(self) -> Any:
+        self._throw_empty()
+        return self.val.pop()
+
+    def sm_peek(self) -> Any:
+        self._throw_empty()
+        return correct_type(self.val[-1])
+
+
 class Table(Generic[KT, VT], Attrs):
     __slots__ = ("val",)
 
@@ -884,20 +1424,27 @@ class Table(Generic[KT, VT], Attrs):
     def __contains__(self, element: object) -> bool:
         return element in self.val
 
+    def _eq(self, other: object) -> bool:
+        if not isinstance(other, Table) or self.val.keys() != other.val.keys():
+            return False
+        return all(equals(v, other.val[k]) for k, v in self.val.items())
+
     def __eq__(self, other: object) -> Number:
-        if isinstance(other, Table):
-            return Num(self.val == other.val)
-        return Num(0)
+        return Num(self._eq(other))
 
     def __ne__(self, other: object) -> Number:
-        if isinstance(other, Table):
-            return Num(self.val != other.val)
-        return Num(1)
+        return Num(not self._eq(other))
 
     @guard("+")
     def __add__(self, other: Any) -> Table[KT, VT]:
         return Table(self.val | other.val)
 
+    def _iadd(self, other: object) -> Attrs:
+        if not isinstance(other, Table):
+            return correct_type(self + other)
+        self.val |= correct_type(other).val
+        return self
+
     def __invert__(self) -> Table[VT, KT]:
         return Table({v: k for k, v in self.val.items()})
 
@@ -910,6 +1457,14 @@ class Table(Generic[KT, VT], Attrs):
             raise SamariumValueError(msg) from None
         return Table(c)
 
+    def _isub(self, other: KT) -> Table[KT, VT]:
+        try:
+            del self.val[other]
+        except KeyError:
+            msg = f"key not found: {other}"
+            raise SamariumValueError(msg) from None
+        return self
+
     def __matmul__(self, other: object) -> Zip:
         return Zip(self, other)
 
@@ -944,7 +1499,7 @@ class Null(Singleton, Attrs):
         return self is not other
 
     def __hash__(self) -> int:
-        return cast(int, self.hash().val)
+        return hash(self.val)
 
     def hash(self) -> Number:
         return Num(hash(self.val))
@@ -961,7 +1516,7 @@ NULL = Null()
 
 
 class Slice(Attrs):
-    __slots__ = ("start", "stop", "step", "tup", "range", "val")
+    __slots__ = ("start", "stop", "step", "tup", "range", "val", "hash_value")
 
     def __init__(self, start: Any, stop: Any = NULL, step: Any = NULL) -> None:
         if step.val == 0:
@@ -981,6 +1536,7 @@ class Slice(Attrs):
             msg = "slice values have to be integers"
             raise SamariumTypeError(msg) from None
         self.val = slice(*self.tup)
+        self.hash_value: int | None = None
 
     def __bool__(self) -> bool:
         return bool(self.range)
@@ -1033,10 +1589,13 @@ class Slice(Attrs):
         return Num(1)
 
     def __hash__(self) -> int:
-        return cast(int, self.hash().val)
+        # Slices are immutable, so their hash only needs computing once
+        if self.hash_value is None:
+            self.hash_value = hash(self.tup)
+        return self.hash_value
 
     def hash(self) -> Number:
-        return Num(hash(self.tup))
+        return Num(hash(self))
 
     def random(self) -> Number:
         return Num(choice(self.range))
@@ -1170,29 +1729,49 @@ class Function(Attrs):
         func.__code__ = func.__code__.replace(
             co_flags=flags & ~4, co_argcount=code.co_argcount + self.varargs
         )
+        if self.varargs and func.__defaults__:
+            # Defaults apply to the last positional parameters, which now
+            # include the varargs one, always passed by name
+            func.__defaults__ = (*func.__defaults__, MISSING)
         self.func = func
-        self.param_count = len(signature(func).parameters) - self.varargs
+        parameters = signature(func).parameters
+        self.param_count = len(parameters) - self.varargs
+        self.is_method = "self" in parameters
         self.inst = inst
+        # Number of positional arguments taken by a call, i.e. without self for
+        # bound methods; varargs are passed by name past those
+        self.arity = self.param_count - (inst is not None)
+        self.varargs_name: str | None = [*parameters][-1] if self.varargs else None
+
+    def __get__(self, instance: object, owner: type | None = None) -> Function:
+        if instance is None or not self.is_method:
+            return self
+        # Binding copies the function instead of building it from scratch, as
+        # __init__ would inspect the signature and patch the code object again
+        bound = object.__new__(type(self))
+        bound.__dict__.update(self.__dict__)
+        bound.inst = instance
+        bound.arity = self.param_count - 1
+        return bound
 
     def __str__(self) -> str:
         return get_name(self.func)
 
     def __call__(self, *args: Any) -> Any:
         for arg in args:
-            check_type(arg)
+            if type(arg) not in EXACT_SHARED_TYPES:
+                check_type(arg)
         supplied = len(args)
-        posargs, args = args[: self.param_count], args[self.param_count :]
-        if self.inst is not None:
-            posargs = (self.inst, *posargs)
-        if not self.varargs and args:
-            msg = f"too many arguments ({supplied}/{self.param_count})"
-            raise SamariumTypeError(msg)
         try:
-            out = correct_type(
-                self.func(*posargs, Array(args))
-                if self.varargs
-                else self.func(*posargs)
-            )
+            if self.varargs:
+                out = self._call_varargs(args)
+            elif supplied > self.arity:
+                msg = f"too many arguments ({supplied}/{self.arity})"
+                raise SamariumTypeError(msg)
+            elif self.inst is None:
+                out = self.func(*args)
+            else:
+                out = self.func(self.inst, *args)
         except TypeError as e:
             errmsg = str(e)
             if m := MISSING_POSARG.search(errmsg):
@@ -1202,7 +1781,15 @@ class Function(Attrs):
                 msg = "missing instance"
                 raise SamariumTypeError(msg) from None
             raise
-        return out
+        return out if type(out) in EXACT_SHARED_TYPES else correct_type(out)
+
+    def _call_varargs(self, args: tuple[Any, ...]) -> Any:
+        posargs = args[: self.arity]
+        varargs: Array[Any] = Array(args[self.arity :])
+        if self.inst is not None:
+            posargs = (self.inst, *posargs)
+        # Only set up as the calling convention of functions with varargs
+        return self.func(*posargs, **{cast(str, self.varargs_name): varargs})
 
     def __and__(self, other: Any) -> Function:
         if isinstance(other, type):
@@ -1229,6 +1816,29 @@ class Function(Attrs):
         return Num(self.param_count + self.varargs)
 
 
+# Built once, `X | Y` unions would otherwise be rebuilt on every call
+SHARED_TYPES = (
+    Bytes,
+    Deque,
+    Null,
+    Number,
+    NumArray,
+    Queue,
+    Stack,
+    String,
+    StringBuilder,
+    Slice,
+    Enum,
+    Type,
+    Module,
+    Zip,
+    Function,
+)
+SEQUENCE_TYPES = (list, tuple, Array)
+# Checked by exact type first, skipping isinstance()'s subclass checks
+EXACT_SHARED_TYPES = frozenset(SHARED_TYPES)
+
+
 def check_type(obj: Any) -> None:
     if isinstance(obj, property):
         msg = "cannot use a special method on a type"
@@ -1241,9 +1851,7 @@ def check_type(obj: Any) -> None:
 def correct_type(obj: T, *objs: T) -> T | Attrs:
     if objs:
         return Array(map(correct_type, (obj, *objs)))  # type: ignore[arg-type]
-    if isinstance(
-        obj, Null | Number | String | Slice | Enum | Type | Module | Zip | Function
-    ):
+    if type(obj) in EXACT_SHARED_TYPES or isinstance(obj, SHARED_TYPES):
         return obj
     if obj is None:
         return NULL
@@ -1251,7 +1859,7 @@ def correct_type(obj: T, *objs: T) -> T | Attrs:
         return Num(obj)
     if isinstance(obj, GeneratorType):
         return Iterator(obj)
-    if isinstance(obj, list | tuple | Array):
+    if isinstance(obj, SEQUENCE_TYPES):
         return Array(map(correct_type, obj))
     if isinstance(obj, Table):
         return Table({correct_type(k): correct_type(v) for k, v in obj.val.items()})
@@ -1259,17 +1867,252 @@ def correct_type(obj: T, *objs: T) -> T | Attrs:
     return obj
 
 
+# Comparisons made by the runtime itself use native bools, rather than
+# the Numbers returned to Samarium code by the comparison operators
+
+
+def equals(a: object, b: object) -> bool:
+    # Identical objects are equal, as in Python's list comparisons
+    if a is b:
+        return True
+    if (eq := getattr(type(a), "_eq", None)) is not None:
+        return eq(a, b)
+    return bool(a == b)
+
+
+def equal_to(obj: object) -> Callable[[object], bool]:
+    # Like Python's list searches, each element is compared from its own side
+    return lambda item: equals(item, obj)
+
+
+def contains(items: Iterable[Any], obj: object) -> bool:
+    if type(obj) is Number and obj.val == obj.val:
+        # Inlines Number._eq for the common case of searching for a number
+        val = obj.val
+        return any(i.val == val if type(i) is Number else equals(i, obj) for i in items)
+    return any(map(equal_to(obj), items))
+
+
+def find(items: list[Any], obj: object) -> int | None:
+    return next(compress(count(), map(equal_to(obj), items)), None)
+
+
+def differing(a: Sequence[Any], b: Sequence[Any]) -> PyIterator[int]:
+    # Identical objects are skipped at C speed, as Python's list comparisons do
+    return compress(count(), map(operator.is_not, a, b))
+
+
+def compare(a: Sequence[Any], b: Sequence[Any], op: Callable[[Any, Any], Any]) -> bool:
+    """Orders two sequences lexicographically, like Python's list comparisons"""
+    for i in differing(a, b):
+        if not equals(a[i], b[i]):
+            return bool(op(a[i], b[i]))
+    return op(len(a), len(b))
+
+
+# `+:`, `-:` and `|:` on a variable may only update the object in place when
+# the variable holds its only reference, as arguments and loop variables share
+# objects with the caller and strings are shared between variables. Anything
+# else gets a new object, like the regular operator would have returned.
+# Reference counts are a CPython detail, and from 3.14 on references held by
+# the interpreter may be borrowed without being counted, so everywhere else
+# objects are never updated in place
+REFCOUNTS = sys.implementation.name == "cpython" and sys.version_info < (3, 14)
+
+
+def unshared_refcount() -> int:
+    """Returns the reference count the functions below see on an object held by
+    a single variable, which depends on the Python version"""
+
+    def update(obj: object, _: object) -> int:
+        return sys.getrefcount(obj)
+
+    probe = object()
+    return update(probe, None) if REFCOUNTS else 0
+
+
+UNSHARED_REFCOUNT = unshared_refcount()
+
+
+def add_in_place(obj: Any, other: object) -> Attrs:
+    if type(obj) in (Array, String, Table) and (
+        REFCOUNTS and sys.getrefcount(obj) <= UNSHARED_REFCOUNT
+    ):
+        return obj._iadd(other)
+    return correct_type(operator.iadd(obj, other))
+
+
+def subtract_in_place(obj: Any, other: object) -> Attrs:
+    if type(obj) in (Array, Table) and (
+        REFCOUNTS and sys.getrefcount(obj) <= UNSHARED_REFCOUNT
+    ):
+        return obj._isub(other)
+    return correct_type(operator.isub(obj, other))
+
+
+def union_in_place(obj: Any, other: object) -> Attrs:
+    if type(obj) is Array and (REFCOUNTS and sys.getrefcount(obj) <= UNSHARED_REFCOUNT):
+        return obj._ior(other)
+    return correct_type(operator.ior(obj, other))
+
+
+# Array set operations hash their elements when they can, falling back to
+# pairwise comparisons when any of them can't be hashed
+UNHASHABLE = (TypeError, NotDefinedError, SamariumTypeError)
+
+
+def union(items: list[Any], added: list[Any]) -> list[Any]:
+    """Appends the elements of `added` not already in `items` or added before"""
+    with suppress(*UNHASHABLE):
+        seen = set(items)
+        new = [i for i in dict.fromkeys(added) if i not in seen]
+        return [*items, *new]
+    items = items.copy()
+    for i in added:
+        if not contains(items, i):
+            items.append(i)
+    return items
+
+
+def intersection(items: list[Any], kept: list[Any]) -> list[Any]:
+    """Returns the elements of `kept` which are in `items`"""
+    with suppress(*UNHASHABLE):
+        lookup = set(items)
+        return [i for i in kept if i in lookup]
+    return [i for i in kept if contains(items, i)]
+
+
+def without(items: list[Any], removed: list[Any], *, strict: bool = False) -> list[Any]:
+    """Removes the first occurrence in `items` of each element of `removed`"""
+    with suppress(*UNHASHABLE):
+        counts = Counter(removed)
+        if strict:
+            available = Counter(items)
+            for i in removed:
+                available[i] -= 1
+                if available[i] < 0:
+                    msg = f"{i!r} not in array"
+                    raise SamariumValueError(msg)
+        new = []
+        for i in items:
+            if counts.get(i):
+                counts[i] -= 1
+            else:
+                new.append(i)
+        return new
+    items = items.copy()
+    for i in removed:
+        if (index := find(items, i)) is not None:
+            del items[index]
+        elif strict:
+            msg = f"{i!r} not in array"
+            raise SamariumValueError(msg)
+    return items
+
+
 def is_valid_index(obj: Attrs, index: Number) -> bool:
     len_ = len(obj.val)
     return -len_ <= index.val < len_ and index.is_int
 
 
+def check_slice_size(obj: Attrs, index: Slice, size: int, items: str) -> None:
+    # Only extended slices have to be replaced with as many items as they span
+    if index.step.val in (None, 1):
+        return
+    span = len(range(*index.val.indices(len(obj.val))))
+    if size != span:
+        msg = f"cannot assign {size} {items} to an extended slice of size {span}"
+        raise SamariumValueError(msg)
+
+
+def to_chars(value: object) -> list[str]:
+    if isinstance(value, String):
+        return [*value.val]
+    if isinstance(value, StringBuilder):
+        return value.val.copy()
+    msg = f"cannot build a string from {get_type_name(value)}"
+    raise SamariumTypeError(msg)
+
+
+def to_buffer(value: object) -> bytes | bytearray | memoryview:
+    if isinstance(value, Bytes):
+        return value.val
+    if isinstance(value, String):
+        return value.val.encode()
+    if isinstance(value, Number):
+        value = Array([value])
+    if isinstance(value, Array):
+        if set(map(type, value.val)) <= {Number}:
+            try:
+                return bytes(map(operator.attrgetter("val"), value.val))
+            except ValueError:
+                msg = "bytes must be in range 0 to 255"
+                raise SamariumValueError(msg) from None
+            except TypeError:
+                pass
+        msg = "Bytes can only contain integers"
+        raise SamariumTypeError(msg)
+    msg = f"cannot build Bytes from {get_type_name(value)}"
+    raise SamariumTypeError(msg)
+
+
+# NumArrays keep their values unboxed, in 64-bit arrays when they fit and in
+# a list of Python numbers otherwise, so that results match Number's
+
+
+def pack(values: Iterable[int | float]) -> array | list[int | float]:
+    values = list(values)
+    types = set(map(type, values))
+    if invalid := types - {int, bool, float}:
+        msg = f"cannot cast {invalid.pop().__name__} to Number"
+        raise SamariumTypeError(msg)
+    with suppress(OverflowError):
+        if types <= {int, bool}:
+            return array("q", values)
+        # Integers can only be stored as doubles if they don't lose precision
+        if all(isinstance(v, float) or float(v) == v for v in values):
+            return array("d", values)
+    return values
+
+
+def to_numarray(values: Iterable[int | float]) -> NumArray:
+    out = NumArray()
+    out.val = pack(values)
+    return out
+
+
+def integers(
+    values: array | list[int | float], operator: str
+) -> array | list[int | float]:
+    if isinstance(values, array) and values.typecode == "q":
+        return values
+    if not all(isinstance(v, int) or v.is_integer() for v in values):
+        msg = f"cannot use {operator} with non-integer numbers"
+        raise SamariumValueError(msg)
+    return pack(map(int, values))
+
+
 def param_count(func: Callable) -> int:
     with suppress(AttributeError):
         return func.param_count
     return len(signature(func).parameters) + isinstance(func, MethodType)
 
 
+# The typecode of 4-byte unsigned integers, whose arrays hold UTF-32 code units
+# (the C types behind "I" and "L" differ in size between platforms)
+CODE_UNIT = next((t for t in "IL" if array(t).itemsize == 4), None)
+# Matches the byte order of array(CODE_UNIT).tobytes(), without a BOM to strip
+UTF32 = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+
+
+def shift(string: str, by: int) -> str:
+    table = {c: (c + by) % 0x10FFFF for c in map(ord, set(string))}
+    if string.isascii() and max(table.values(), default=0) < 0x80:
+        ascii_table = bytes(map(table.get, range(0x80), repeat(0))) + bytes(0x80)
+        return string.encode().translate(ascii_table).decode()
+    return string.translate(table)
+
+
 def to_chr(code: int) -> str:
     if 0 <= code < 0x110000:
         return chr(code)
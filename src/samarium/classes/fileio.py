@@ -1,14 +1,31 @@
 from __future__ import annotations
 
+import mmap
+from contextlib import suppress
 from enum import Enum
 from os import write
 from pathlib import Path
 from typing import IO, TYPE_CHECKING, Any, cast
 
-from samarium.classes.base import NULL, Array, Attrs, Null, Num, Number, Slice, String
+from samarium.classes.base import (
+    NULL,
+    Array,
+    Attrs,
+    Bytes,
+    Null,
+    Num,
+    Number,
+    Slice,
+    String,
+    to_buffer,
+)
 from samarium.exceptions import SamariumIOError, SamariumTypeError, SamariumValueError
 from samarium.utils import get_type_name
 
+# Not available on Windows
+MADV_RANDOM: int | None = getattr(mmap, "MADV_RANDOM", None)
+MADV_SEQUENTIAL: int | None = getattr(mmap, "MADV_SEQUENTIAL", None)
+
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
@@ -18,6 +35,8 @@ class Mode(Enum):
     WRITE = "w"
     READ_WRITE = "r+"
     APPEND = "a"
+    # Read-only, the file is opened in binary read mode and mapped into memory
+    MAP = "m"
 
 
 class FileManager:
@@ -35,7 +54,12 @@ class FileManager:
             if not path.is_int:
                 msg = "cannot use non-integers"
                 raise SamariumValueError(msg)
+            if mode is Mode.MAP:
+                msg = "cannot map a standard stream"
+                raise SamariumIOError(msg)
         pth = cast("str | int", path.val)
+        if mode is Mode.MAP:
+            return MappedFile(cast(str, pth), binary=binary)
         if isinstance(pth, str):
             f = Path(pth).open(mode.value + "b" * binary)  # noqa: SIM115
         else:
@@ -51,36 +75,27 @@ class FileManager:
         path: String | File | Number,
         mode: Mode,
         *,
-        data: String | Array | None = None,
+        data: String | Bytes | Array | None = None,
         binary: bool = False,
-    ) -> String | Array | Null:
+    ) -> String | Bytes | Null:
         if isinstance(path, String):
             p = Path(path.val)
             if mode is Mode.READ:
-                content = p.read_bytes() if binary else p.read_text()
-                return Array(map(Num, content)) if binary else String(content)
+                return Bytes(p.read_bytes()) if binary else String(p.read_text())
             if data is None:
                 msg = "missing data"
                 raise SamariumIOError(msg)
-            if not isinstance(data, Array):
+            if isinstance(data, Bytes | Array):
+                p.write_bytes(to_buffer(data))
+            else:
                 p.write_text(data.val)
-                return NULL
-            if isinstance(data, Array):
-                bytes_ = b""
-                for i in data.val:
-                    try:
-                        bytes_ += i.val.to_bytes(1, "big")
-                    except AssertionError:  # TODO(trag1c): why AssertionError?
-                        msg = "some items in the array are not of type Integer"
-                        raise SamariumTypeError(msg) from None
-                p.write_bytes(bytes_)
         elif isinstance(path, Number):
             if not path.is_int:
                 msg = "cannot use non-integers"
                 raise SamariumValueError(msg)
             if mode in {Mode.APPEND, Mode.WRITE}:
                 fd = cast(int, path.val)
-                write(fd, str(data).encode())
+                write(fd, data.val if isinstance(data, Bytes) else str(data).encode())
             else:
                 msg = (
                     "reading from file descriptors is "
@@ -118,14 +133,10 @@ class File(Attrs):
         self.val.close()
         return NULL
 
-    def __iter__(self) -> Iterator[String] | Iterator[Array[Number]]:
-        if self.binary:
-            for line in self.val:
-                yield Array(map(Num, list(line)))
-        else:
-            yield from map(String, self.val)
+    def __iter__(self) -> Iterator[String] | Iterator[Bytes]:
+        yield from map(Bytes if self.binary else String, self.val)
 
-    def __getitem__(self, index: Any) -> Array | String | Number | Null:
+    def __getitem__(self, index: Any) -> Bytes | String | Number | Null:
         if isinstance(index, Slice):
             if index.is_empty():
                 return Num(self.val.tell())
@@ -138,47 +149,122 @@ class File(Attrs):
                 if not (index.start.is_int or index.stop.is_int):
                     msg = f"invalid index: {index}"
                     raise SamariumValueError(msg)
-                start = cast(int, index.start.val)
-                stop = cast(int, index.stop.val)
-                current_pos = self.val.tell()
-                self.val.seek(start)
-                data = self.val.read(stop - start)
-                self.val.seek(current_pos)
-                if self.binary:
-                    if isinstance(data, bytes):
-                        data = [*data]
-                    return Array(map(Num, data))
-                return String(data)
+                return self._read_range(
+                    cast(int, index.start.val), cast(int, index.stop.val)
+                )
             return self[Slice(Num(0), slice.stop, slice.step)]
 
         self.val.seek(index.val)
         return NULL
 
-    def load(self, bytes_: Number | None = None) -> String | Array:
+    def _read_range(self, start: int, stop: int) -> String | Bytes:
+        current_pos = self.val.tell()
+        self.val.seek(start)
+        data = self.val.read(stop - start)
+        self.val.seek(current_pos)
+        return self._wrap(data)
+
+    def _wrap(self, data: str | bytes) -> String | Bytes:
+        return Bytes(data) if self.binary else String(data)
+
+    def load(self, bytes_: Number | None = None) -> String | Bytes:
         if bytes_ is None:
             bytes_ = Num(-1)
         if not bytes_.is_int:
             msg = "cannot use non-integers"
             raise SamariumValueError(msg)
-        val = self.val.read(cast(int, bytes_.val))
-        if self.binary:
-            return Array(map(Num, val))
-        return String(val)
-
-    def save(self, data: String | Array) -> Null:
-        if (self.binary and isinstance(data, String)) or (
-            not self.binary and isinstance(data, Array)
-        ):
+        return self._wrap(self.val.read(cast(int, bytes_.val)))
+
+    def save(self, data: String | Bytes | Array) -> Null:
+        if self.binary != isinstance(data, Bytes | Array):
             raise SamariumTypeError(get_type_name(data))
-        if isinstance(data, Array):
-            bytes_ = b""
-            for i in data.val:
-                try:
-                    bytes_ += i.val.to_bytes(1, "big")
-                except AssertionError:
-                    msg = "some items in the array are not of type Integer"
-                    raise SamariumTypeError(msg) from None
-            self.val.write(bytes_)
-        else:
-            self.val.write(data.val)
+        self.val.write(to_buffer(data) if self.binary else data.val)
+        return NULL
+
+
+class MappedFile(File):
+    __slots__ = ()
+    val: mmap.mmap | None  # type: ignore[assignment]
+
+    def __init__(self, path: str, *, binary: bool) -> None:
+        with Path(path).open("rb") as f:
+            try:
+                map_ = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                msg = "cannot map an empty file"
+                raise SamariumIOError(msg) from None
+        self.binary = binary
+        self.mode = Mode.MAP.name
+        self.path = path
+        self.val = map_
+        # Read-ahead around every page fault makes cold random reads
+        # several times slower than seeking and reading
+        self._advise(MADV_RANDOM)
+
+    def _advise(self, advice: int | None) -> None:
+        if advice is not None and self.val is not None:
+            self.val.madvise(advice)
+
+    def _map(self) -> mmap.mmap:
+        if self.val is None:
+            msg = "cannot read from a closed file"
+            raise SamariumIOError(msg)
+        return self.val
+
+    def __bool__(self) -> bool:
+        return self.val is not None
+
+    def __invert__(self) -> Null:
+        if self.val is not None:
+            # Slices still viewing the map keep it alive, so it's unmapped
+            # once they're gone
+            with suppress(BufferError):
+                self.val.close()
+            self.val = None
         return NULL
+
+    def __iter__(self) -> Iterator[String] | Iterator[Bytes]:
+        readline = self._map().readline
+        self._advise(MADV_SEQUENTIAL)
+        try:
+            yield from map(self._wrap, iter(readline, b""))
+        finally:
+            self._advise(MADV_RANDOM)
+
+    def __getitem__(self, index: Any) -> Bytes | String | Number | Null:
+        self._map()
+        return super().__getitem__(index)
+
+    def _read_range(self, start: int, stop: int) -> String | Bytes:
+        map_ = self._map()
+        if not self.binary:
+            return decode(map_[start:stop])
+        out = Bytes()
+        out.val = memoryview(map_)[start:stop]
+        return out
+
+    def _wrap(self, data: bytes) -> String | Bytes:
+        return Bytes(data) if self.binary else decode(data)
+
+    def load(self, bytes_: Number | None = None) -> String | Bytes:
+        self._map()
+        self._advise(MADV_SEQUENTIAL)
+        try:
+            return super().load(bytes_)
+        finally:
+            self._advise(MADV_RANDOM)
+
+    def save(self, _: String | Bytes | Array) -> Null:
+        msg = "cannot write to a mapped file"
+        raise SamariumIOError(msg)
+
+    def special(self) -> Number:
+        return Num(len(self._map()))
+
+
+def decode(data: bytes) -> String:
+    try:
+        return String(data.decode())
+    except UnicodeDecodeError:
+        msg = "cannot decode the mapped file as UTF-8"
+        raise SamariumIOError(msg) from None
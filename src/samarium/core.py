@@ -8,6 +8,7 @@ import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from samarium import backend, cache
 from samarium import exceptions as exc
 from samarium.builtins import (
     dtnow,
@@ -36,12 +37,15 @@ from samarium.classes import (
     String,
     Table,
     UserAttrs,
+    add_in_place,
     correct_type,
+    subtract_in_place,
+    union_in_place,
 )
 from samarium.exceptions import DAHLIA
-from samarium.imports import merge_objects, parse_string, resolve_path
+from samarium.imports import locate_modules, merge_objects
 from samarium.runtime import Runtime
-from samarium.tokenizer import tokenize
+from samarium.tokenizer import tokenize_with_lines
 from samarium.transpiler import Registry, Transpiler
 from samarium.utils import sysexit
 
@@ -49,36 +53,51 @@ if TYPE_CHECKING:
     from samarium.classes import Attrs
 
 
+MODULES: dict[Path, Registry] = {}
+
+
 def import_to_scope(data: str, reg: Registry, source: str) -> None:
-    modules = parse_string(data)
-    for mod in modules:
-        if mod.name == "samarium":
-            raise exc.SamariumRecursionError
-        path = resolve_path(mod.name, source)
-        mod_path = (path / f"{mod.name}.sm").resolve()
-        if mod_path.exists():
-            imported = run(mod_path.read_text(), Registry({}), mod_path)
-        else:
-            spec = importlib.util.spec_from_file_location(
-                mod.name, str(path / f"{mod.name}.py")
-            )
-            if spec is None:
-                msg = "couldn't load spec"
-                raise ValueError(msg)
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[mod.name] = module
-            if spec.loader is None:
-                msg = "ModuleSpec.loader is None"
-                raise ValueError(msg)
-            spec.loader.exec_module(module)
-            registry = {
-                f"sm_{k}": v
-                for k, v in vars(module).items()
-                if getattr(v, "__pyexported__", False)
-            }
-            imported = Registry(registry)
-
-        reg.vars.update(merge_objects(reg, imported, mod))
+    for mod, path in locate_modules(data, source):
+        try:
+            imported = MODULES[path]
+        except KeyError:
+            imported = MODULES[path] = load_module(mod.name, path)
+        reg.vars.update(merge_objects(imported, mod))
+
+
+def load_module(name: str, path: Path) -> Registry:
+    if path.suffix == ".sm":
+        return run(path.read_text(), Registry({}), path)
+    spec = importlib.util.spec_from_file_location(name, str(path))
+    if spec is None:
+        msg = "couldn't load spec"
+        raise ValueError(msg)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    if spec.loader is None:
+        msg = "ModuleSpec.loader is None"
+        raise ValueError(msg)
+    spec.loader.exec_module(module)
+    registry = {
+        f"sm_{k}": v
+        for k, v in vars(module).items()
+        if getattr(v, "__pyexported__", False)
+    }
+    return Registry(registry)
+
+
+def reload(path: Path | str) -> Registry:
+    """Re-executes a module, replacing its entry in the module registry"""
+    path = Path(path).resolve()
+    locate_modules.cache_clear()
+    MODULES[path] = load_module(path.stem, path)
+    return MODULES[path]
+
+
+def unload() -> None:
+    """Forgets every loaded module, so each is re-executed on its next import"""
+    locate_modules.cache_clear()
+    MODULES.clear()
 
 
 def import_inline(data: str, source: str) -> Attrs:
@@ -98,31 +117,41 @@ def run(
 ) -> Registry:
     runtime_state = Runtime.repl
     Runtime.repl = repl
-    code = Transpiler(tokenize(code), reg).transpile().output
-    if load_template:
-        code = (
-            (Path(__file__).resolve().parent / "template.txt")
-            .read_text()
-            .replace("{{CODE}}", code)
-            .replace(
-                "{{SOURCE}}",
-                str(Path(source).resolve() if isinstance(source, str) else source),
-            )
-        )
+    if isinstance(source, str):
+        source = Path(source).resolve()
+    optimize = Runtime.optimize and not repl
+    cacheable = load_template and not (debug or repl) and source.is_file()
+    bytecode = cache.load(code, source, optimize=optimize) if cacheable else None
+    if bytecode is None:
+        tokens, lines = tokenize_with_lines(code)
+        src = Transpiler(tokens, reg, lines).transpile().output
     try:
-        if debug:
-            code = ast.unparse(ast.parse(code))
-            DAHLIA.print(f"&j{code}", file=sys.stderr)
-        reg.vars = globals() | reg.vars
         if repl:
+            if debug:
+                src = ast.unparse(ast.parse(src))
+                DAHLIA.print(f"&j{src}", file=sys.stderr)
+            reg.vars = globals() | reg.vars
             try:
-                res = eval(code, reg.vars)
+                res = eval(src, reg.vars)
                 if not (res is None or res is NULL):
                     print(repr(res))
             except SyntaxError:
-                exec(code, reg.vars)
+                exec(src, reg.vars)
         else:
-            exec(code, reg.vars)
+            if bytecode is None:
+                template_source = str(source) if load_template else None
+                if debug:
+                    tree = backend.to_ast(reg, template_source, optimize=optimize)
+                    DAHLIA.print(f"&j{ast.unparse(tree)}", file=sys.stderr)
+                    bytecode = compile(tree, "<string>", "exec")
+                else:
+                    bytecode = backend.compile_output(
+                        reg, template_source, optimize=optimize
+                    )
+                if cacheable:
+                    cache.store(code, source, bytecode, optimize=optimize)
+            reg.vars = globals() | reg.vars
+            exec(bytecode, reg.vars)
     except Exception as e:  # noqa: BLE001
         exc.handle_exception(e)
     Runtime.repl = runtime_state
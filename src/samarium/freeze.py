@@ -0,0 +1,33 @@
+"""Freezes the standard library into a precompiled image loaded on import"""
+
+from __future__ import annotations
+
+import marshal
+from typing import TYPE_CHECKING
+
+from samarium import backend
+from samarium.cache import FROZEN, STDLIB, cache_key, frozen_name
+from samarium.tokenizer import tokenize_with_lines
+from samarium.transpiler import Registry, Transpiler
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from types import CodeType
+
+
+def freeze() -> Path:
+    image: dict[str, tuple[bytes, CodeType]] = {}
+    for path in sorted(STDLIB.glob("*.sm")):
+        code = path.read_text()
+        for optimize in (False, True):
+            tokens, lines = tokenize_with_lines(code)
+            reg = Transpiler(tokens, Registry({}), lines).transpile()
+            bytecode = backend.compile_output(reg, "{{SOURCE}}", optimize=optimize)
+            key = cache_key(code, path.stem, optimize=optimize)
+            image[frozen_name(path.stem, optimize=optimize)] = (key, bytecode)
+    FROZEN.write_bytes(marshal.dumps(image))
+    return FROZEN
+
+
+if __name__ == "__main__":
+    print(f"Frozen {len(list(STDLIB.glob('*.sm')))} modules into {freeze()}")
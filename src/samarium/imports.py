@@ -2,12 +2,17 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from re import Pattern, compile, sub
 from typing import TYPE_CHECKING
 
 from samarium.classes import Attrs, Module
-from samarium.exceptions import SamariumImportError, SamariumSyntaxError
+from samarium.exceptions import (
+    SamariumImportError,
+    SamariumRecursionError,
+    SamariumSyntaxError,
+)
 
 if TYPE_CHECKING:
     from samarium.transpiler import Registry
@@ -69,12 +74,26 @@ def format_string(string: str) -> str:
     return string
 
 
-def merge_objects(reg: Registry, imported: Registry, module: Mod) -> dict[str, Attrs]:
-    vars_ = reg.vars.copy()
+@lru_cache
+def locate_modules(data: str, source: str) -> tuple[tuple[Mod, Path], ...]:
+    located = []
+    for mod in parse_string(data):
+        if mod.name == "samarium":
+            raise SamariumRecursionError
+        path = resolve_path(mod.name, source)
+        if (mod_path := (path / f"{mod.name}.sm").resolve()).exists():
+            located.append((mod, mod_path))
+        else:
+            located.append((mod, (path / f"{mod.name}.py").resolve()))
+    return tuple(located)
+
+
+def merge_objects(imported: Registry, module: Mod) -> dict[str, Attrs]:
     if module.objects is False:
-        return vars_ | {f"sm_{module.alias}": Module(module.name, imported.vars)}
+        return {f"sm_{module.alias}": Module(module.name, imported.vars)}
     if module.objects is True:
-        return vars_ | {k: v for k, v in imported.vars.items() if k.startswith("sm_")}
+        return {k: v for k, v in imported.vars.items() if k.startswith("sm_")}
+    vars_: dict[str, Attrs] = {}
     for obj in module.objects:
         try:
             vars_[f"sm_{obj.alias}"] = imported.vars[f"sm_{obj.name}"]
@@ -0,0 +1,204 @@
+# ruff: noqa: INP001
+from __future__ import annotations
+
+import functools
+import itertools
+from typing import TYPE_CHECKING, Any, cast
+
+from samarium.classes import NULL, Array, Null, Num, Number, Slice, String
+from samarium.classes.base import equal_to
+from samarium.exceptions import SamariumTypeError, SamariumValueError
+from samarium.python import export
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable as PyIterable
+    from collections.abc import Iterator as PyIterator
+    from typing import TypeAlias
+
+    from samarium.classes import (
+        Attrs,
+        Bytes,
+        File,
+        Function,
+        Iterator,
+        NumArray,
+        StringBuilder,
+        Table,
+        Zip,
+    )
+
+    Sliceable: TypeAlias = Array[Any] | Bytes | NumArray | String | StringBuilder
+    Iterable: TypeAlias = (
+        Sliceable | File | Iterator[Any] | Slice | Table[Any, Any] | Zip
+    )
+
+ZERO = Num(0)
+
+
+def length(array: Attrs) -> int:
+    return cast(int, array.special().val)
+
+
+def slice_of(array: Sliceable, start: int, stop: int) -> Attrs:
+    return array[Slice(Num(start), Num(stop))]
+
+
+def spread(function: Function, array: Iterable) -> PyIterator[Any]:
+    if length(function) == 1:
+        return map(function, array)
+    return itertools.starmap(function, cast("PyIterable[Array[Any]]", array))
+
+
+@export(convert=False)
+def accumulate(array: Sliceable, function: Function) -> PyIterator[Attrs]:
+    first = array[ZERO]
+    yield from itertools.accumulate(
+        itertools.islice(array, 1, None), function, initial=first
+    )
+
+
+@export(convert=False)
+def all_(array: Iterable) -> Number:
+    return Num(all(array))
+
+
+@export(convert=False)
+def any_(array: Iterable) -> Number:
+    return Num(any(array))
+
+
+@export(convert=False)
+def chunks(array: Sliceable, size: Number) -> PyIterator[Attrs]:
+    # Validated up front so that the error is raised at the call site
+    if type(size) is not Number or not size.is_int:
+        msg = "chunk size has to be an integer"
+        raise SamariumTypeError(msg)
+    if size.val <= 0:
+        msg = "chunk size has to be positive"
+        raise SamariumValueError(msg)
+    step = cast(int, size.val)
+    return (slice_of(array, i, i + step) for i in range(0, length(array), step))
+
+
+@export(convert=False)
+def count(array: Iterable, target: Attrs) -> Number:
+    if target not in array:
+        return Num(0)
+    return Num(sum(map(equal_to(target), array)))
+
+
+@export(convert=False)
+def cycle(iter_: Iterable) -> PyIterator[Attrs]:
+    yield from itertools.cycle(iter_)
+
+
+@export(convert=False)
+def drop_while(array: Iterable, function: Function) -> PyIterator[Attrs]:
+    yield from itertools.dropwhile(function, array)
+
+
+@export(convert=False)
+def filter_(function: Function, array: Iterable) -> PyIterator[Attrs]:
+    if length(function) == 1:
+        yield from filter(function, array)
+    else:
+        rows = cast("PyIterable[Array[Any]]", array)
+        yield from (e for e in rows if function(*e))
+
+
+@export(convert=False)
+def filter_false(function: Function, array: Iterable) -> PyIterator[Attrs]:
+    yield from itertools.filterfalse(function, array)
+
+
+@export(convert=False)
+def find(array: Iterable, target: Attrs) -> Number:
+    if type(array) is String:
+        if type(target) is String:
+            return Num(array.val.find(target.val))
+        return Num(-1)
+    return Num(
+        next(itertools.compress(itertools.count(), map(equal_to(target), array)), -1)
+    )
+
+
+@export(convert=False)
+def find_all(array: Iterable, target: Attrs) -> PyIterator[Number]:
+    if type(array) is String and type(target) is String and len(target.val) > 1:
+        i = array.val.find(target.val)
+        while i != -1:
+            yield Num(i)
+            i = array.val.find(target.val, i + 1)
+    else:
+        yield from map(
+            Num, itertools.compress(itertools.count(), map(equal_to(target), array))
+        )
+
+
+@export(convert=False)
+def flatten(array: Iterable, depth: Number | Null = NULL) -> Array:
+    levels = itertools.repeat(None)
+    if isinstance(depth, Number):
+        if not depth.is_int:
+            msg = "depth has to be an integer"
+            raise SamariumTypeError(msg)
+        if depth.val < 0:
+            msg = "depth cannot be negative"
+            raise SamariumValueError(msg)
+        levels = itertools.repeat(None, cast(int, depth.val))
+    items = list(array)
+    for _ in levels:
+        if not any(type(i) is Array for i in items):
+            break
+        items = [
+            *itertools.chain.from_iterable(
+                i.val if type(i) is Array else (i,) for i in items
+            )
+        ]
+    return Array(items)
+
+
+@export(convert=False)
+def map_(function: Function, array: Iterable) -> PyIterator[Attrs]:
+    yield from spread(function, array)
+
+
+@export(convert=False)
+def pairwise(array: Sliceable) -> PyIterator[Attrs]:
+    for i in range(length(array) - 1):
+        yield slice_of(array, i, i + 2)
+
+
+@export(convert=False)
+def reduce(function: Function, array: Sliceable) -> Attrs:
+    first = array[ZERO]
+    return functools.reduce(function, itertools.islice(array, 1, None), first)
+
+
+@export(convert=False)
+def reverse(array: Sliceable) -> PyIterator[Attrs]:
+    if type(array) is Array:
+        yield from reversed(array.val)
+    else:
+        for i in range(length(array) - 1, -1, -1):
+            yield array[Num(i)]
+
+
+@export(convert=False)
+def sorted_(array: Iterable, key: Function | Null = NULL) -> Array:
+    if isinstance(key, Null):
+        return Array(sorted(array))
+    # Ties between keys are broken by the values themselves
+    return Array(sorted(array, key=lambda v: (key(v), v)))
+
+
+@export(convert=False)
+def take_while(array: Iterable, function: Function) -> PyIterator[Attrs]:
+    yield from itertools.takewhile(function, array)
+
+
+@export(convert=False)
+def zip_longest(fill: Attrs, *arrays: Iterable) -> PyIterator[Attrs]:
+    yield from itertools.chain.from_iterable(
+        itertools.zip_longest(*arrays, fillvalue=fill)
+    )
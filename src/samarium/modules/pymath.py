@@ -0,0 +1,214 @@
+# ruff: noqa: INP001
+from __future__ import annotations
+
+import functools
+import math
+import operator
+from typing import TYPE_CHECKING, Any, cast
+
+from samarium.classes import NULL, Array, Num, NumArray, Number, String
+from samarium.exceptions import SamariumError, SamariumValueError
+from samarium.python import export
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from samarium.classes import Attrs
+
+ZERO = Num(0)
+ONE = Num(1)
+
+SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+# Miller-Rabin with the bases above is exact for every n below this bound
+MILLER_RABIN_BOUND = 3_317_044_064_679_887_385_961_981
+
+
+def numbers(array: Attrs) -> Sequence[int | float] | None:
+    if type(array) is NumArray:
+        return array.val
+    if type(array) is Array and all(type(e) is Number for e in array.val):
+        return [e.val for e in array.val]
+    return None
+
+
+def integers(array: Attrs) -> Sequence[int] | None:
+    # Number arithmetic turns integral floats back into ints after each step,
+    # so only integers can be reduced in one go with the same result
+    values = numbers(array)
+    if values is None or not all(isinstance(v, int) for v in values):
+        return None
+    return cast("Sequence[int]", values)
+
+
+def balanced_product(values: Sequence[int]) -> int:
+    # Multiplying pairs of similar size keeps big integer products subquadratic
+    while len(values) > 1:
+        leftover = values[-1:] if len(values) & 1 else []
+        values = [*map(operator.mul, values[::2], values[1::2]), *leftover]
+    return values[0] if values else 1
+
+
+def halve(x: int, n: int) -> int:
+    x %= n
+    return (x + n) >> 1 if x & 1 else x >> 1
+
+
+def jacobi(a: int, n: int) -> int:
+    a %= n
+    result = 1
+    while a:
+        while not a & 1:
+            a >>= 1
+            if n & 7 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a & 3 == n & 3 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def strong_probable_prime(n: int, base: int) -> bool:
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    x = pow(base, d >> s, n)
+    if x in (1, n - 1):
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+
+def strong_lucas_probable_prime(n: int) -> bool:
+    if math.isqrt(n) ** 2 == n:
+        return False
+    # Selfridge's method: the first D in 5, -7, 9, -11, ... with (D/n) = -1
+    d = 5
+    while (j := jacobi(d, n)) != -1:
+        if j == 0:
+            return False
+        d = -d - 2 if d > 0 else -d + 2
+    q = (1 - d) // 4
+    k = n + 1
+    s = (k & -k).bit_length() - 1
+    u, v, qk = 1, 1, q
+    for bit in bin(k >> s)[3:]:
+        u, v, qk = u * v % n, (v * v - 2 * qk) % n, qk * qk % n
+        if bit == "1":
+            u, v, qk = halve(u + v, n), halve(d * u + v, n), qk * q % n
+    if not u or not v:
+        return True
+    for _ in range(s - 1):
+        v = (v * v - 2 * qk) % n
+        if not v:
+            return True
+        qk = qk * qk % n
+    return False
+
+
+def to_base(n: Attrs, spec: str, name: str) -> String:
+    if type(n) is not Number or not n.is_int:
+        msg = f"cannot convert a non-integer to {name}"
+        raise SamariumError(msg)
+    return String(format(n.val, spec))
+
+
+def extremum(
+    array: Attrs,
+    values: tuple[Attrs, ...],
+    pick: Callable[[Iterable[Any]], Any],
+    name: str,
+) -> Attrs:
+    if values:
+        array = Array([array, *values])
+    if (items := numbers(array)) is not None:
+        if items:
+            return Num(pick(items))
+    elif elements := list(cast("Iterable[Attrs]", array)):
+        return pick(elements)
+    msg = f"empty array has no {name}"
+    raise SamariumValueError(msg)
+
+
+@export(convert=False)
+def factorial(n: Number) -> Number:
+    if n < ZERO:
+        msg = "factorial is defined only for non-negative numbers"
+        raise SamariumError(msg)
+    if not n.is_int:
+        msg = "n has to be an integer"
+        raise SamariumError(msg)
+    return Num(math.factorial(cast(int, n.val)))
+
+
+@export(convert=False)
+def gcd(a: Number, b: Number) -> Number:
+    if type(a) is type(b) is Number and a.is_int and b.is_int:
+        return Num(math.gcd(cast(int, a.val), cast(int, b.val)))
+    while b:
+        a, b = b, a % b
+    return -a if a < ZERO else a
+
+
+@export(convert=False)
+def is_prime(n: Number) -> Number:
+    if type(n) is not Number or not n.is_int:
+        return ZERO
+    k = cast(int, n.val)
+    if k < 2:
+        return ZERO
+    for p in SMALL_PRIMES:
+        if not k % p:
+            return Num(k == p)
+    if k < SMALL_PRIMES[-1] ** 2:
+        return ONE
+    if k < MILLER_RABIN_BOUND:
+        return Num(all(strong_probable_prime(k, p) for p in SMALL_PRIMES))
+    # Baillie-PSW, which has no known counterexamples
+    return Num(strong_probable_prime(k, 2) and strong_lucas_probable_prime(k))
+
+
+@export(convert=False)
+def max_(array: Attrs, *values: Attrs) -> Attrs:
+    return extremum(array, values, max, "maximum")
+
+
+@export(convert=False)
+def min_(array: Attrs, *values: Attrs) -> Attrs:
+    return extremum(array, values, min, "minimum")
+
+
+@export(convert=False)
+def product(array: Attrs) -> Attrs:
+    if (values := integers(array)) is not None:
+        return Num(balanced_product(values))
+    return functools.reduce(operator.mul, cast("Iterable[Attrs]", array), ONE)
+
+
+@export(convert=False)
+def sum_(array: Attrs, start: Attrs = NULL) -> Attrs:
+    start = ZERO if start is NULL else start
+    if (
+        type(start) is Number
+        and isinstance(start.val, int)
+        and (values := integers(array)) is not None
+    ):
+        return Num(sum(values, start.val))
+    return functools.reduce(operator.add, cast("Iterable[Attrs]", array), start)
+
+
+@export(convert=False)
+def to_bin(n: Number) -> String:
+    return to_base(n, "b", "bin")
+
+
+@export(convert=False)
+def to_hex(n: Number) -> String:
+    return to_base(n, "x", "hex")
+
+
+@export(convert=False)
+def to_oct(n: Number) -> String:
+    return to_base(n, "o", "oct")
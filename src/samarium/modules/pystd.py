@@ -1,9 +1,18 @@
 # ruff: noqa: INP001
 from __future__ import annotations
 
+from samarium.classes import Bytes, Deque, NumArray, Queue, Stack, StringBuilder
 from samarium.python import export
 
 
 @export
 def round_(x: float, ndigits: int | None = None) -> float:
     return round(x, ndigits)
+
+
+export(Bytes)
+export(Deque)
+export(NumArray)
+export(Queue)
+export(Stack)
+export(StringBuilder)
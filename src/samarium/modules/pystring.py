@@ -0,0 +1,248 @@
+# ruff: noqa: INP001
+from __future__ import annotations
+
+import string as pystring
+from typing import TYPE_CHECKING, Any, cast
+
+from samarium.classes import NULL, Array, Null, Num, Number, Slice, String, Table
+from samarium.exceptions import SamariumError, SamariumTypeError
+from samarium.python import export
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import TypeAlias
+
+    from samarium.classes import Attrs, Bytes, NumArray, StringBuilder
+
+    Sliceable: TypeAlias = Array[Any] | Bytes | NumArray | String | StringBuilder
+
+LETTERS = String(pystring.ascii_letters)
+ALPHANUMERIC = String(pystring.ascii_letters + pystring.digits)
+DIGITS = String(pystring.digits)
+HEXDIGITS = String("0123456789abcdef")
+OCTDIGITS = String(pystring.octdigits)
+
+# Only ASCII letters are cased characters
+TO_LOWER = str.maketrans(pystring.ascii_uppercase, pystring.ascii_lowercase)
+TO_UPPER = str.maketrans(pystring.ascii_lowercase, pystring.ascii_uppercase)
+SWAPCASE = str.maketrans(pystring.ascii_letters, pystring.ascii_letters.swapcase())
+
+
+def lower(string: str) -> str:
+    return string.lower() if string.isascii() else string.translate(TO_LOWER)
+
+
+def upper(string: str) -> str:
+    return string.upper() if string.isascii() else string.translate(TO_UPPER)
+
+
+def capitalize_str(string: str) -> str:
+    return upper(string[:1]) + lower(string[1:])
+
+
+def title_str(string: str) -> str:
+    return " ".join(map(capitalize_str, string.split(" ")))
+
+
+def check_string(string: Attrs) -> str:
+    if type(string) is not String:
+        msg = f"invalid type: {type(string).__name__}"
+        raise SamariumError(msg)
+    return string.val
+
+
+def prefix_of(string: Sliceable, prefix: Sliceable) -> bool:
+    if type(string) is String and type(prefix) is String:
+        return string.val.startswith(prefix.val)
+    size = cast(int, prefix.special().val)
+    if size > string.special().val:
+        return False
+    return bool(string[Slice(NULL, Num(size))] == prefix)
+
+
+def suffix_of(string: Sliceable, suffix: Sliceable) -> bool:
+    # An empty suffix only ends an empty string
+    if type(string) is String and type(suffix) is String:
+        return string.val == suffix.val or (
+            suffix.val != "" and string.val.endswith(suffix.val)
+        )
+    size = cast(int, suffix.special().val)
+    if size > string.special().val:
+        return False
+    return bool(string[Slice(Num(-size))] == suffix)
+
+
+def in_group(string: Sliceable, group: Sliceable) -> bool:
+    if type(string) is String and type(group) is String:
+        return set(string.val).issubset(group.val)
+    return all(char in group for char in string)
+
+
+def strip_prefix(string: str, prefix: str) -> str:
+    if not prefix:
+        return string
+    start = 0
+    while string.startswith(prefix, start):
+        start += len(prefix)
+    return string[start:]
+
+
+def strip_suffix(string: str, suffix: str) -> str:
+    if not suffix:
+        return string
+    stop = len(string)
+    while string.endswith(suffix, 0, stop):
+        stop -= len(suffix)
+    return string[:stop]
+
+
+@export(convert=False)
+def capitalize(string: String) -> String:
+    return String(capitalize_str(check_string(string)))
+
+
+@export(convert=False)
+def ends_with(string: Sliceable, suffix: Sliceable) -> Number:
+    return Num(suffix_of(string, suffix))
+
+
+@export(convert=False)
+def is_alphabetic(string: Sliceable) -> Number:
+    return Num(in_group(string, LETTERS))
+
+
+@export(convert=False)
+def is_alphanumeric(string: Sliceable) -> Number:
+    return Num(in_group(string, ALPHANUMERIC))
+
+
+@export(convert=False)
+def is_capitalized(string: String) -> Number:
+    return Num(string.val == capitalize_str(check_string(string)))
+
+
+@export(convert=False)
+def is_decimal(string: Sliceable) -> Number:
+    return Num(in_group(string, DIGITS))
+
+
+@export(convert=False)
+def is_hexadecimal(string: Sliceable) -> Number:
+    return Num(in_group(string, HEXDIGITS))
+
+
+@export(convert=False)
+def is_in_group(string: Sliceable, group: Sliceable) -> Number:
+    return Num(in_group(string, group))
+
+
+@export(convert=False)
+def is_lower(string: String) -> Number:
+    return Num(string.val == lower(check_string(string)))
+
+
+@export(convert=False)
+def is_octal(string: Sliceable) -> Number:
+    return Num(in_group(string, OCTDIGITS))
+
+
+@export(convert=False)
+def is_title(string: String) -> Number:
+    return Num(string.val == title_str(check_string(string)))
+
+
+@export(convert=False)
+def is_upper(string: String) -> Number:
+    return Num(string.val == upper(check_string(string)))
+
+
+@export(convert=False)
+def is_wrapped(string: Sliceable, chars: Sliceable) -> Number:
+    return Num(prefix_of(string, chars) and suffix_of(string, chars))
+
+
+@export(convert=False)
+def join(iterable: Iterable[Attrs], delimiter: String | Null = NULL) -> String:
+    sep = "" if isinstance(delimiter, Null) else delimiter.val
+    return String(sep.join(map(str, iterable)))
+
+
+@export(convert=False)
+def replace(
+    string: String, replacements: Table[String, String], count: Number | Null = NULL
+) -> String:
+    if type(replacements) is not Table:
+        msg = f"invalid type for replacements: {type(replacements).__name__}"
+        raise SamariumError(msg)
+    # A negative count replaces every occurrence
+    limit = -1
+    if isinstance(count, Number):
+        if not count.is_int:
+            msg = "count has to be an integer"
+            raise SamariumTypeError(msg)
+        limit = cast(int, count.val)
+    if not limit or not replacements.val:
+        return string
+    out = string.val
+    for from_, to in tuple(replacements.val.items()):
+        out = out.replace(from_.val, to.val, limit)
+    return String(out)
+
+
+@export(convert=False)
+def split(
+    string: String, separator: String | Array[String] | Null = NULL
+) -> Array[String]:
+    text = string.val
+    if isinstance(separator, Null):
+        separator = String(" ")
+    elif type(separator) is Array and separator.val:
+        first, *rest = separator.val
+        for other in dict.fromkeys(rest):
+            text = text.replace(other.val, first.val)
+        separator = first
+    if not separator:
+        msg = "empty separator\n&1[Note] use []?!(string) instead"
+        raise SamariumError(msg)
+    return Array(list(map(String, text.split(cast(String, separator).val))))
+
+
+@export(convert=False)
+def starts_with(string: Sliceable, prefix: Sliceable) -> Number:
+    return Num(prefix_of(string, prefix))
+
+
+@export(convert=False)
+def strip(string: String, chars: String | Null = NULL) -> String:
+    affix = " " if isinstance(chars, Null) else chars.val
+    return String(strip_prefix(strip_suffix(string.val, affix), affix))
+
+
+@export(convert=False)
+def strip_left(string: String, prefix: String) -> String:
+    return String(strip_prefix(string.val, prefix.val))
+
+
+@export(convert=False)
+def strip_right(string: String, suffix: String) -> String:
+    return String(strip_suffix(string.val, suffix.val))
+
+
+@export(convert=False)
+def swapcase(string: String) -> String:
+    return String(check_string(string).translate(SWAPCASE))
+
+
+@export(convert=False)
+def title(string: String) -> String:
+    return String(title_str(check_string(string)))
+
+
+@export(convert=False)
+def to_lower(string: String) -> String:
+    return String(lower(check_string(string)))
+
+
+@export(convert=False)
+def to_upper(string: String) -> String:
+    return String(upper(check_string(string)))
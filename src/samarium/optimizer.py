@@ -0,0 +1,193 @@
+"""Constant folding and literal hoisting for transpiled code"""
+
+from __future__ import annotations
+
+import ast
+import math
+import operator
+from collections import Counter
+from typing import TYPE_CHECKING, Any, cast
+
+from samarium.classes import Num, Number, String
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+LITERALS: dict[str, tuple[Callable[[Any], Number | String], tuple[type, ...]]] = {
+    "Num": (Num, (int, float)),
+    "String": (String, (str,)),
+}
+
+BINARY_OPERATORS: dict[type[ast.AST], Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Pow: operator.pow,
+    ast.Mod: operator.mod,
+    ast.BitAnd: operator.and_,
+    ast.BitOr: operator.or_,
+    ast.BitXor: operator.xor,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+UNARY_OPERATORS: dict[type[ast.AST], Callable[[Any], Any]] = {
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+    ast.Invert: operator.invert,
+}
+
+# Folding shouldn't bloat the compiled code or take ages to compute
+MAX_INT_BITS = 4096
+MAX_STRING_LENGTH = 4096
+
+NAME_CHARS = str.maketrans(".-+", "_mp")
+
+
+def literal(node: ast.AST) -> Number | String | None:
+    """Returns the value of a `Num(...)` or `String(...)` literal node"""
+    if not (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id in LITERALS
+        and len(node.args) == 1
+        and not node.keywords
+        and isinstance(arg := node.args[0], ast.Constant)
+    ):
+        return None
+    cls, types = LITERALS[node.func.id]
+    if type(arg.value) not in types:
+        return None
+    return cls(arg.value)
+
+
+def located(node: ast.expr, like: ast.AST) -> ast.expr:
+    for child in ast.walk(node):
+        ast.copy_location(child, like)
+    return node
+
+
+def to_literal(value: object, node: ast.AST) -> ast.expr | None:
+    if type(value) is Number:
+        if isinstance(value.val, int):
+            if value.val.bit_length() > MAX_INT_BITS:
+                return None
+        elif not math.isfinite(value.val):
+            return None
+        name = "Num"
+    elif type(value) is String:
+        if len(value.val) > MAX_STRING_LENGTH:
+            return None
+        name = "String"
+    else:
+        return None
+    call = ast.Call(ast.Name(name, ast.Load()), [ast.Constant(value.val)], [])
+    return located(call, node)
+
+
+def is_expensive(op: ast.AST, left: object, right: object) -> bool:
+    if isinstance(op, ast.Pow) and type(left) is type(right) is Number:
+        return (
+            left.is_int
+            and right.is_int
+            and right.val > 0
+            and abs(left.val).bit_length() * right.val > MAX_INT_BITS
+        )
+    if isinstance(op, ast.Mult):
+        string, times = (left, right) if type(left) is String else (right, left)
+        return (
+            type(string) is String
+            and type(times) is Number
+            and len(string.val) * times.val > MAX_STRING_LENGTH
+        )
+    return False
+
+
+class Optimizer(ast.NodeTransformer):
+    """Folds operations on literals and hoists number literals into constants"""
+
+    def __init__(self) -> None:
+        self.constants: dict[str, ast.Call] = {}
+        self.uses: Counter[str] = Counter()
+
+    def value(self, node: ast.AST) -> Number | String | None:
+        if isinstance(node, ast.Name) and node.id in self.constants:
+            return literal(self.constants[node.id])
+        return literal(node)
+
+    def hoist(self, node: ast.expr) -> ast.expr:
+        # Strings are mutable, so only numbers can be shared
+        if not isinstance(literal(node), Number):
+            return node
+        value = cast(ast.Constant, cast(ast.Call, node).args[0]).value
+        # Names are derived from the value, so they never clash between
+        # separately compiled modules or REPL inputs sharing a namespace
+        name = f"_num_{value!r}".translate(NAME_CHARS)
+        self.constants.setdefault(name, cast(ast.Call, node))
+        self.uses[name] += 1
+        return located(ast.Name(name, ast.Load()), node)
+
+    def fold(
+        self, node: ast.expr, operands: list[ast.expr], function: Callable[[], object]
+    ) -> ast.expr:
+        try:
+            value = function()
+        except Exception:  # noqa: BLE001
+            # Errors are left for the program to raise at runtime
+            return node
+        if (folded := to_literal(value, node)) is None:
+            return node
+        for operand in operands:
+            if isinstance(operand, ast.Name):
+                self.uses[operand.id] -= 1
+        return self.hoist(folded)
+
+    def visit_Call(self, node: ast.Call) -> ast.expr:  # noqa: N802
+        self.generic_visit(node)
+        return self.hoist(node)
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.expr:  # noqa: N802
+        self.generic_visit(node)
+        op = BINARY_OPERATORS.get(type(node.op))
+        left, right = self.value(node.left), self.value(node.right)
+        if op is None or left is None or right is None:
+            return node
+        if is_expensive(node.op, left, right):
+            return node
+        return self.fold(node, [node.left, node.right], lambda: op(left, right))
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.expr:  # noqa: N802
+        self.generic_visit(node)
+        op = UNARY_OPERATORS.get(type(node.op))
+        if op is None or (operand := self.value(node.operand)) is None:
+            return node
+        return self.fold(node, [node.operand], lambda: op(operand))
+
+    def visit_Compare(self, node: ast.Compare) -> ast.expr:  # noqa: N802
+        self.generic_visit(node)
+        if len(node.ops) != 1:
+            return node
+        op = BINARY_OPERATORS.get(type(node.ops[0]))
+        operands = [node.left, node.comparators[0]]
+        left, right = map(self.value, operands)
+        if op is None or left is None or right is None:
+            return node
+        return self.fold(node, operands, lambda: op(left, right))
+
+
+def optimize(tree: ast.Module) -> ast.Module:
+    optimizer = Optimizer()
+    tree = optimizer.visit(tree)
+    tree.body[:0] = [
+        ast.copy_location(
+            ast.Assign([located(ast.Name(name, ast.Store()), value)], value), value
+        )
+        for name, value in optimizer.constants.items()
+        if optimizer.uses[name]
+    ]
+    return tree
@@ -3,13 +3,16 @@ from __future__ import annotations
 from collections.abc import Callable
 from collections.abc import Iterable as PyIterable
 from enum import Enum as PyEnum
+from functools import partial
 from io import BufferedIOBase, BufferedReader, BufferedWriter, TextIOWrapper
 from types import FunctionType
+from typing import overload
 
 from samarium.classes import (
     NULL,
     Array,
     Attrs,
+    Bytes,
     Enum,
     File,
     Function,
@@ -17,9 +20,11 @@ from samarium.classes import (
     Mode,
     Null,
     Num,
+    NumArray,
     Number,
     Slice,
     String,
+    StringBuilder,
     Table,
     Zip,
 )
@@ -44,6 +49,12 @@ def to_python(obj: object) -> object:
         return obj.val
     if isinstance(obj, Null):
         return None
+    if isinstance(obj, StringBuilder):
+        return str(obj)
+    if isinstance(obj, Bytes):
+        return bytes(obj.val)
+    if isinstance(obj, NumArray):
+        return list(obj.val)
     if isinstance(obj, Array):
         return [to_python(i) for i in obj.val]
     if isinstance(obj, Table):
@@ -64,6 +75,8 @@ def to_samarium(obj: object) -> Attrs:
         return Num(obj)
     if isinstance(obj, str):
         return String(obj)
+    if isinstance(obj, bytes | bytearray | memoryview):
+        return Bytes(bytes(obj))
     if obj is None:
         return NULL
     if isinstance(obj, FunctionType):
@@ -97,13 +110,39 @@ def to_samarium(obj: object) -> Attrs:
     raise TypeError(msg)
 
 
-def export(func: Callable) -> Callable[..., Attrs]:
+@overload
+def export(func: Callable, *, convert: bool = True) -> Callable[..., Attrs]: ...
+
+
+@overload
+def export(
+    func: None = None, *, convert: bool = True
+) -> Callable[[Callable], Callable[..., Attrs]]: ...
+
+
+def export(
+    func: Callable | None = None, *, convert: bool = True
+) -> Callable[..., Attrs] | Callable[[Callable], Callable[..., Attrs]]:
     """Wraps a Python function to be used in Samarium"""
 
+    if func is None:
+        return partial(export, convert=convert)
+
+    if isinstance(func, type) and issubclass(func, Attrs):
+        # Samarium types need no conversions
+        func.__pyexported__ = True
+        return func
+
     if not isinstance(func, FunctionType):
         msg = f"cannot export a non-function type {get_type_name(func)!r}"
         raise TypeError(msg)
 
+    if not convert:
+        # The function takes and returns Samarium objects as they are
+        f = Function(func)
+        f.__pyexported__ = True
+        return f
+
     def wrapper(*_args: Attrs) -> Attrs:
         return to_samarium(func(*map(to_python, _args)))
 
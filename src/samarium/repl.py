@@ -19,10 +19,14 @@ if sys.platform not in ("win32", "cygwin"):
     # used by input() to provide elaborate line editing & history features
     import readline  # noqa: F401
 
-from crossandra import CrossandraError
-
 from samarium import core
-from samarium.exceptions import DAHLIA, SamariumSyntaxError, handle_exception
+from samarium.exceptions import (
+    DAHLIA,
+    SamariumError,
+    SamariumSyntaxError,
+    handle_exception,
+)
+from samarium.imports import locate_modules
 from samarium.runtime import Runtime
 from samarium.tokenizer import tokenize
 from samarium.transpiler import Registry, match_brackets
@@ -37,6 +41,7 @@ COMMANDS = (
         "clear",
         "color",
         "debug",
+        "reload",
         "restore",
         "run",
         "session",
@@ -102,6 +107,7 @@ HELP_TEXT = "\n".join(
                 "color", msg="changes the prompt color, see &2:? color&R for details"
             ),
             Command("debug", msg="toggles debug mode"),
+            Command("reload", arg="[module]", msg="re-executes imported modules"),
             Command("restore", msg="restores the previous session"),
             Command("t", "time", msg="times the execution of the following statement"),
             Command("undo", msg="undoes the last statement"),
@@ -256,7 +262,7 @@ class REPL:
             CONFIG_FILE.touch()
         self.config = REPLConfig.load()
         cache_cleanup(self.config.session_lifetime)
-        self.registry = Registry(globals())
+        self.registry = repl_registry()
         self.session = Session(
             COLOR_TO_CODE.get(self.config.color, ""),
             debug=debug,
@@ -264,7 +270,7 @@ class REPL:
 
     def load_session(self, session: Session, *, reset_registry: bool = False) -> None:
         if reset_registry:
-            self.registry = Registry(globals())
+            self.registry = repl_registry()
         with (
             Path("/dev/null").open("w") as dev_null,
             redirect_stdout(dev_null),
@@ -312,6 +318,15 @@ class REPL:
             self.session.debug = not self.session.debug
         elif cmd in TIME:
             return arg
+        elif cmd == "reload":
+            if not arg:
+                core.unload()
+                return None
+            try:
+                for _, path in locate_modules(arg, self.registry.vars["__file__"]):
+                    core.reload(path)
+            except SamariumError as e:
+                handle_exception(e)
         elif cmd == "run":
             if not arg:
                 repl_err("missing file")
@@ -441,7 +456,7 @@ class REPL:
             stmt += ";"
             try:
                 error, stack = match_brackets(tokenize(stmt, repl=True))
-            except CrossandraError as e:
+            except SamariumSyntaxError as e:
                 if '"' in str(e):
                     error, stack = 1, []
                 else:
@@ -529,6 +544,11 @@ def is_command(stmt: str) -> bool:
     return True
 
 
+def repl_registry() -> Registry:
+    # Imports are resolved relative to `__file__`, i.e. the working directory
+    return Registry(globals() | {"__file__": str(Path.cwd() / "<repl>")})
+
+
 def repl_err(msg: str) -> None:
     DAHLIA.print(f"&4[REPLError] {msg}", file=sys.stderr)
 
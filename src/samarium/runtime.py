@@ -1,2 +1,3 @@
 class Runtime:
+    optimize = False
     repl = False
@@ -2,14 +2,15 @@ from __future__ import annotations
 
 import re
 import sys
-from typing import cast
-
-from crossandra import Crossandra, CrossandraError, Rule, common
+from typing import TYPE_CHECKING, cast
 
 from samarium.exceptions import SamariumSyntaxError, handle_exception
 from samarium.tokens import Token
 from samarium.utils import convert_float
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 def to_number(string: str) -> int | float:
     string = string.replace("/", "1").replace("\\", "0")
@@ -18,31 +19,80 @@ def to_number(string: str) -> int | float:
     return convert_float(string, base=2, sep="`")
 
 
-Tokenlike = Token | str | int
+def to_string(string: str) -> str:
+    return string.replace("\n", r"\n")
+
+
+Tokenlike = Token | str | int | float
 
 SM_BIT = r"[\\\/]"
 
-crossandra = Crossandra(
-    Token,
-    ignore_whitespace=True,
-    rules=[
-        Rule(r"==<.*>==", flags=re.M | re.S, ignore=True),
-        Rule(r"==[^\n]*", flags=re.M | re.S, ignore=True),
-        Rule(
-            common.DOUBLE_QUOTED_STRING.pattern,
-            lambda x: x.replace("\n", r"\n"),
-            flags=re.S,
-        ),
-        Rule(rf"{SM_BIT}+`?{SM_BIT}*|`{SM_BIT}*", to_number),
-        Rule(r"\w+"),
-    ],
+TOKENS = {token.value: token for token in Token}
+WHITESPACE = " \f\t\v\r\n"
+
+# Alternatives are tried in order: the longest token wins over its prefixes
+# and tokens take priority over comments, strings, numbers and names
+RULES = {
+    "TOKEN": "|".join(map(re.escape, sorted(TOKENS, key=len, reverse=True))),
+    "COMMENT": r"(?s:==<.*>==)|==[^\n]*",
+    "STRING": r'(?s:".*?(?<!\\)(?:\\\\)*?")',
+    "NUMBER": rf"{SM_BIT}+`?{SM_BIT}*|`{SM_BIT}*",
+    "NAME": r"\w+",
+}
+
+PATTERN = re.compile(
+    f"[{WHITESPACE}]*(?:"
+    + "|".join(f"(?P<{name}>{pattern})" for name, pattern in RULES.items())
+    + ")"
 )
 
+CONVERTERS: dict[str, Callable[[str], Tokenlike]] = {
+    "TOKEN": TOKENS.__getitem__,
+    "STRING": to_string,
+    "NUMBER": to_number,
+    "NAME": str,
+}
+
+
+def scan(code: str) -> tuple[list[Tokenlike], list[int]]:
+    """Returns the tokens of `code` along with the line each of them starts on"""
+    code = code.replace("\r\n", "\n")
+    tokens: list[Tokenlike] = []
+    lines: list[int] = []
+    append = tokens.append
+    append_line = lines.append
+    count = code.count
+    match = PATTERN.match
+    converters = CONVERTERS
+    line, last = 1, 0
+    pos, end = 0, len(code.rstrip(WHITESPACE))
+    while pos < end:
+        m = match(code, pos)
+        if m is None:
+            msg = f"invalid token: {code[pos:].lstrip(WHITESPACE)[0]!r}"
+            raise SamariumSyntaxError(msg)
+        # Every alternative is a named group, so one of them always matched
+        group = cast(str, m.lastgroup)
+        if (conv := converters.get(group)) is not None:
+            start = m.start(group)
+            line += count("\n", last, start)
+            last = start
+            append(conv(m.group(group)))
+            append_line(line)
+        pos = m.end()
+    return tokens, lines
+
 
 def tokenize(code: str, *, repl: bool = False) -> list[Tokenlike]:
+    return tokenize_with_lines(code, repl=repl)[0]
+
+
+def tokenize_with_lines(
+    code: str, *, repl: bool = False
+) -> tuple[list[Tokenlike], list[int]]:
     try:
-        return cast(list[Tokenlike], crossandra.tokenize(code))
-    except CrossandraError as e:
+        return scan(code)
+    except SamariumSyntaxError as e:
         if repl:
             raise
         errmsg = str(e)
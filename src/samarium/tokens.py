@@ -85,10 +85,12 @@ class Token(Enum):
     FILE_READ = "<~~"
     FILE_WRITE = "~~>"
     FILE_READ_WRITE = "<~>"
+    FILE_MAP = "<~@"
     FILE_BINARY_APPEND = "&%~>"
     FILE_BINARY_READ = "<~%"
     FILE_BINARY_WRITE = "%~>"
     FILE_BINARY_READ_WRITE = "<%>"
+    FILE_BINARY_MAP = "<%@"
     FILE_QUICK_APPEND = "&~>"
     FILE_QUICK_READ = "<~"
     FILE_QUICK_WRITE = "~>"
@@ -108,9 +110,9 @@ class Token(Enum):
     ZIP = "><"
 
 
-FILE_IO_TOKENS = [
+FILE_IO_TOKENS = frozenset(
     token for name, token in Token.__members__.items() if name.startswith("FILE_")
-]
+)
 
 OPEN_TOKENS = [
     Token.BRACKET_OPEN,
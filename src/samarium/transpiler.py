@@ -42,6 +42,40 @@ def is_literal(token: object) -> bool:
     return is_quoted(token)
 
 
+def is_new_value(tokens: list[Tokenlike]) -> bool:
+    """Whether an expression only builds values `correct_type` would keep as is"""
+    brackets: list[Tokenlike] = []
+    prev: Tokenlike | None = None
+    nested = repeated = False
+    for token in tokens:
+        if is_literal(token) or token in NEW_VALUE_OPERATORS:
+            repeated = repeated or token is Token.MUL
+        elif token in NEW_VALUE_OPEN:
+            # Calling the result isn't a new value
+            if prev is not None and (is_literal(prev) or prev in CLOSE_TOKENS):
+                return False
+            if token is not Token.PAREN_OPEN:
+                nested = nested or any(b is not Token.PAREN_OPEN for b in brackets)
+            brackets.append(token)
+        elif token in NEW_VALUE_CLOSE:
+            # () is a tuple
+            if prev is Token.PAREN_OPEN:
+                return False
+            brackets.pop()
+        elif token is Token.SEP:
+            if not brackets or brackets[-1] is Token.PAREN_OPEN:
+                return False
+        elif token is Token.TO:
+            if not brackets or brackets[-1] is not Token.TABLE_OPEN:
+                return False
+        else:
+            return False
+        prev = token
+    # Repeating an array shares its elements, so nested arrays and tables
+    # have to be copied by `correct_type`
+    return not (nested and repeated)
+
+
 def is_quoted(token: object) -> bool:
     if isinstance(token, str):
         return token[0] == token[-1] == '"'
@@ -55,9 +89,7 @@ def is_varname(token: object) -> bool:
 def match_brackets(tokens_: list[Tokenlike]) -> tuple[int, list[Token]]:
     stack: list[Token] = []
     token = Token.END
-    tokens: list[Token] = [
-        cast(Token, t) for t in tokens_ if t in OPEN_TOKENS + CLOSE_TOKENS
-    ]
+    tokens: list[Token] = [cast(Token, t) for t in tokens_ if t in BRACKET_TOKENS]
     for token in tokens:
         if token in OPEN_TOKENS:
             stack.append(token)
@@ -74,14 +106,16 @@ def match_brackets(tokens_: list[Tokenlike]) -> tuple[int, list[Token]]:
 
 
 def remove_stars(code: str) -> str:
+    if "*" not in code:
+        return code
     stack = 0
-    new_str = ""
+    new_str = []
     for c in code:
         stack += c in "([{"
         stack -= c in ")]}"
         if c != "*" or stack:
-            new_str += c
-    return new_str
+            new_str.append(c)
+    return "".join(new_str)
 
 
 def throw_syntax(message: str, *, note: str = "") -> None:
@@ -123,6 +157,11 @@ class Scope:
     def current(self) -> str | None:
         return self._get(-1)
 
+    @property
+    def namespace(self) -> str | None:
+        """The innermost function, class or enum scope (None at module level)"""
+        return next((s for s in reversed(self._scope) if s in NAMESPACES), None)
+
 
 class Switch(Enum):
     CLASS_DEF = 0
@@ -136,6 +175,8 @@ class Registry:
     def __init__(self, vars_: dict[str, Attrs]) -> None:
         self._switches = [False] * len(Switch)
         self.output = ""
+        # Samarium source line of each line of the output
+        self.lines: list[int] = []
         self.vars = vars_
 
     def __getitem__(self, switch: Switch) -> bool:
@@ -229,6 +270,35 @@ class Group:
     )
 
 
+BINARY_OPERATORS = Group.operators - {
+    Token.BNOT,
+    Token.NOT,
+    Token.IN,
+    Token.SUB,
+    Token.ADD,
+}
+OPERAND_EXPECTED = Group.operators | {
+    Token.PAREN_OPEN,
+    Token.BRACKET_OPEN,
+    Token.TABLE_OPEN,
+    Token.IF,
+    Token.WHILE,
+    Token.CATCH,
+}
+OPERATORS_OR_ELSE = Group.operators | {Token.ELSE}
+OPERATORS_OR_NULLABLE_END = Group.operators | {Token.DEFAULT, Token.CATCH}
+BRACKET_TOKENS = frozenset(OPEN_TOKENS + CLOSE_TOKENS)
+NEW_VALUE_OPERATORS = Group.operators - {Token.IN}
+NEW_VALUE_OPEN = frozenset((Token.PAREN_OPEN, Token.BRACKET_OPEN, Token.TABLE_OPEN))
+NEW_VALUE_CLOSE = frozenset((Token.PAREN_CLOSE, Token.BRACKET_CLOSE, Token.TABLE_CLOSE))
+# Augmented assignments to variables which may update the value in place
+UPDATE_FUNCTIONS = {
+    "+": "add_in_place",
+    "-": "subtract_in_place",
+    "|": "union_in_place",
+}
+NAMESPACES = frozenset(("function", "class", "enum"))
+
 OPEN_TO_CLOSE = {
     Token.BRACKET_OPEN: Token.BRACKET_CLOSE,
     Token.BRACE_OPEN: Token.BRACE_CLOSE,
@@ -298,6 +368,8 @@ NULLABLE_TOKENS = {
     Token.CATCH,
 }
 
+OPERATORS_OR_NULLABLE = NULLABLE_TOKENS | OPERATORS_OR_ELSE
+
 UNPACK_TRIGGERS = {
     Token.PAREN_OPEN,
     Token.BRACKET_OPEN,
@@ -320,7 +392,7 @@ SLICE_OBJECT_TRIGGERS = {
     *Group.operators,
 }
 
-FILE_OPEN_KEYWORDS = {"READ", "WRITE", "READ_WRITE", "APPEND"}
+FILE_OPEN_KEYWORDS = {"READ", "WRITE", "READ_WRITE", "APPEND", "MAP"}
 
 SPECIAL_METHOD_MAPPING = {
     "+": "add",
@@ -369,15 +441,24 @@ IDENTIFIER_BOUNDARY_RIGHT = {
 
 
 class Transpiler:
-    def __init__(self, tokens: list[Tokenlike], registry: Registry) -> None:
+    def __init__(
+        self,
+        tokens: list[Tokenlike],
+        registry: Registry,
+        lines: list[int] | None = None,
+    ) -> None:
         self._class_indent: list[int] = []
-        self._code = ""
+        self._code: list[str] = []
+        self._code_lines: list[int] = [1]
         self._file_token: Token | None = None
         self._indent = 0
         self._index = 0
         self._inline_counter = 0
         self._line: list[str] = []
+        self._line_start = 0
         self._line_tokens: list[Tokenlike] = []
+        self._lines = lines
+        self._name_run: tuple[int, Tokenlike] = (-1, Token.END)
         self._private = False
         self._processed_tokens: list[Tokenlike] = []
         self._reg = registry
@@ -407,6 +488,43 @@ class Transpiler:
     def _token_at(self, offset: int) -> Tokenlike:
         return self._tokens[self._index + offset]
 
+    def _name_run_end(self) -> Tokenlike:
+        # Consecutive names share the token ending their run, so it's only
+        # looked up once per run
+        end, token = self._name_run
+        if end <= self._index:
+            end = self._index
+            while isinstance(token := self._tokens[end], str) or token in (
+                Token.FOR,
+                Token.IF,
+            ):
+                end += 1
+            self._name_run = end, token
+        return token
+
+    def _assigns_new_value(self) -> bool:
+        tokens = self._line_tokens
+        for index in range(len(tokens) - 1, -1, -1):
+            if tokens[index] is Token.ASSIGN:
+                return is_new_value(tokens[index + 1 : -1])
+        return False
+
+    def _is_variable(self, target: str) -> bool:
+        # Names in a class body are class variables, shared by all instances
+        return (
+            target.startswith("sm_")
+            and target.isidentifier()
+            and self._scope.namespace in (None, "function")
+        )
+
+    def _assigns_before_end(self) -> bool:
+        for index in range(self._index + 1, len(self._tokens)):
+            if (token := self._tokens[index]) is Token.ASSIGN:
+                return True
+            if token is Token.END:
+                return False
+        return False
+
     def transpile(self) -> Registry:
         # Matching brackets
         error, data = match_brackets(self._tokens)
@@ -425,7 +543,8 @@ class Transpiler:
                 continue
             self._process_token(index, token)
 
-        self._reg.output = self._code
+        self._reg.output = "".join(self._code)
+        self._reg.lines = self._code_lines
         return self._reg
 
     def _submit_line(self) -> None:
@@ -441,7 +560,10 @@ class Transpiler:
             self._file_io()
 
         # Regular stuff
-        self._code += "\n" + "".join(self._line)
+        line = "\n" + "".join(self._line)
+        self._code.append(line)
+        if self._lines is not None:
+            self._code_lines += [self._lines[self._line_start]] * line.count("\n")
         self._processed_tokens.extend(self._line_tokens)
 
         self._line_tokens = []
@@ -502,22 +624,9 @@ class Transpiler:
         if token is Token.IN and self._prev is Token.NOT:
             pass
         elif (
-            token
-            in Group.operators - {Token.BNOT, Token.NOT, Token.IN, Token.SUB, Token.ADD}
+            token in BINARY_OPERATORS
             and self._prev in Group.operators
-            or (
-                self._prev
-                in Group.operators
-                | {
-                    Token.PAREN_OPEN,
-                    Token.BRACKET_OPEN,
-                    Token.TABLE_OPEN,
-                    Token.IF,
-                    Token.WHILE,
-                    Token.CATCH,
-                }
-                or is_first_token(self._line)
-            )
+            or (self._prev in OPERAND_EXPECTED or is_first_token(self._line))
             and token not in {Token.ADD, Token.SUB, Token.NOT, Token.BNOT}
         ):
             push("NULL")
@@ -591,10 +700,10 @@ class Transpiler:
         else:
             if token is Token.TABLE_CLOSE and self._prev is Token.TO:
                 push("NULL")
-            if token in (
-                Token.PAREN_CLOSE,
-                Token.BRACKET_CLOSE,
-            ) and self._prev in Group.operators | {Token.ELSE}:
+            if (
+                token in (Token.PAREN_CLOSE, Token.BRACKET_CLOSE)
+                and self._prev in OPERATORS_OR_ELSE
+            ):
                 push("NULL")
             push(BRACKET_MAPPING[token])
             return
@@ -661,14 +770,8 @@ class Transpiler:
             )
         elif token is Token.YIELD:
             if is_first_token(self._line):
-                toks = self._tokens[self._index + 1 :]
-                # fmt: off
-                if (
-                    Token.ASSIGN in toks
-                    and toks.index(Token.ASSIGN) < toks.index(Token.END)
-                ):
+                if self._assigns_before_end():
                     push("*")
-                # fmt: on
                 else:
                     push("yield ")
                     if self._next is Token.BRACE_CLOSE:
@@ -733,7 +836,7 @@ class Transpiler:
         elif token is Token.ELSE:
             push(shift + "else ")
         else:  # FOR
-            if self._prev in {Token.ELSE} | Group.operators:
+            if self._prev in OPERATORS_OR_ELSE:
                 push("NULL")
             index = self._index
             if self._scope.current == "slice" and self._next is Token.ATTR:
@@ -744,10 +847,7 @@ class Transpiler:
 
     def _core(self, token: Token, push: Callable) -> None:
         if token is Token.END:
-            if self._prev in Group.operators | {
-                Token.DEFAULT,
-                Token.CATCH,
-            }:
+            if self._prev in OPERATORS_OR_NULLABLE_END:
                 push("NULL")
             if self._scope.current == "enum":
                 if self._token_at(-2) in {token, Token.BRACE_OPEN}:
@@ -762,9 +862,26 @@ class Transpiler:
             if "=" in self._line:
                 start = self._indent > 0
                 assign_idx = self._line.index("=")
-                stop = assign_idx - (self._line[assign_idx - 1] in {*"+-*%&|/^@", "**"})
+                operator = self._line[assign_idx - 1]
+                augmented = operator in {*"+-*%&|/^@", "**"}
+                stop = assign_idx - augmented
                 variable = remove_stars("".join(self._line[start:stop]))
-                push(f";{variable}=correct_type({variable})")
+                if (
+                    augmented
+                    and operator in UPDATE_FUNCTIONS
+                    and self._is_variable(variable)
+                ):
+                    if assign_idx == len(self._line) - 1:
+                        push("NULL")
+                    update = UPDATE_FUNCTIONS[operator]
+                    self._line[stop : assign_idx + 1] = ["=", f"{update}({variable},("]
+                    push("))")
+                elif augmented or not self._assigns_new_value():
+                    push(f";{variable}=correct_type({variable})")
+                else:
+                    # Keeps the value from being the last part of the line,
+                    # where _submit_line would take it for a missing one
+                    push("")
             self._submit_line()
         elif token is Token.ASSIGN:
             if self._line_tokens.count(token) > 1 and self._scope.current != "enum":
@@ -774,13 +891,8 @@ class Transpiler:
             self._reg[Switch.IMPORT] = True
             push("import_to_scope('")
         elif token is Token.SEP:
-            # fmt: off
-            if (
-                self._prev in
-                NULLABLE_TOKENS | Group.operators | {Token.ELSE}
-            ):
+            if self._prev in OPERATORS_OR_NULLABLE:
                 push("NULL")
-            # fmt: on
             push(",")
         elif token is Token.ATTR:
             push(".")
@@ -927,6 +1039,8 @@ class Transpiler:
 
     def _process_token(self, index: int, token: Tokenlike) -> None:
         self._index = index
+        if not self._line_tokens:
+            self._line_start = index
         self._line_tokens.append(token)
 
         push = self._line.append
@@ -949,18 +1063,14 @@ class Transpiler:
                 if self._line_tokens[-2] is Token.INSTANCE:
                     push(".")
             # Identifiers
-            if isinstance(self._prev, str):
-                offset = 0
-                while isinstance(tok := self._token_at(offset), str) or tok in (
-                    Token.FOR,
-                    Token.IF,
-                ):
-                    offset += 1
-                if tok is not Token.FUNCTION:
-                    throw_syntax(
-                        "spaces are not allowed in variable names",
-                        note=f"{self._prev} {token} -> {self._prev}{token}",
-                    )
+            if (
+                isinstance(self._prev, str)
+                and self._name_run_end() is not Token.FUNCTION
+            ):
+                throw_syntax(
+                    "spaces are not allowed in variable names",
+                    note=f"{self._prev} {token} -> {self._prev}{token}",
+                )
             pprev_token = self._token_at(-2)
             if self._prev is Token.ENUM and isinstance(pprev_token, str):
                 if is_quoted(pprev_token):
@@ -987,11 +1097,8 @@ class Transpiler:
             self._file_token = token
             self._line.append("FILE_IO")
 
-        else:
-            for group, func in GROUPS:
-                if token in group:
-                    func(self, token, push)
-                    break
+        elif (func := DISPATCH.get(token)) is not None:
+            func(self, token, push)
 
 
 GROUPS = [
@@ -1004,3 +1111,5 @@ GROUPS = [
     (Group.builtins, Transpiler._builtins),
     (Group.methods, Transpiler._methods),
 ]
+
+DISPATCH = {token: func for group, func in GROUPS for token in group}
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from re import sub
+from functools import lru_cache
+from re import compile, escape
 from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar
 
 from samarium.exceptions import SamariumTypeError, SamariumValueError
@@ -90,13 +91,43 @@ def parse_number(string: str) -> tuple[int | float, bool]:
         return num, isinstance(num, int) or num.is_integer()
 
 
+@lru_cache(maxsize=1024)
+def compile_format(string: str, names: tuple[str, ...]) -> tuple[str | int, ...]:
+    """Splits a format string into literal text and the indices of the fields
+    to insert, each `$` taking the first field whose name follows it"""
+    # Alternatives are tried in order, so earlier fields take precedence
+    match = compile("|".join(map(escape, names))).match if names else None
+    chunks = string.split("$")
+    parts: list[str | int] = []
+    text = chunks[0]
+    i = 1
+    while i < len(chunks):
+        chunk = chunks[i]
+        if not chunk and i + 1 < len(chunks):
+            text += "$" + chunks[i + 1]
+            i += 2
+            continue
+        if match is not None and (m := match(chunk)):
+            parts += [text, names.index(m[0])]
+            text = chunk[m.end() :]
+        else:
+            text += "$" + chunk
+        i += 1
+    parts.append(text)
+    return tuple(parts)
+
+
 def smformat(string: str, fields: str | list[Any] | dict[Any, Any]) -> str:
     if isinstance(fields, str):
         fields = [fields]
-    it = fields.items() if isinstance(fields, dict) else enumerate(fields)
-    for k, v in it:
-        string = sub(rf"(?<!\$)\${k}", str(v), string)
-    return string.replace("$$", "$")
+    if isinstance(fields, dict):
+        names = tuple(map(str, fields))
+        values = list(map(str, fields.values()))
+    else:
+        names = tuple(map(str, range(len(fields))))
+        values = list(map(str, fields))
+    parts = compile_format(string, names)
+    return "".join([values[p] if isinstance(p, int) else p for p in parts])
 
 
 def get_name(obj: Callable[..., Any] | type) -> str:
@@ -0,0 +1,71 @@
+"""Runs the regression programs in tests/cases and compares their output
+
+Every `<name>.sm` is run both as is and with `-O`, and its combined stdout and
+stderr must match `<name>.out`. Pass `--update` to rewrite the expected outputs
+after an intentional change, and program names to run only those.
+"""
+
+# ruff: noqa: INP001
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from difflib import unified_diff
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CASES = Path(__file__).resolve().parent / "cases"
+
+
+def run(program: Path, *, optimize: bool) -> str:
+    env = {**os.environ, "PYTHONPATH": str(ROOT / "src"), "PYTHONHASHSEED": "0"}
+    flags = ["-O"] if optimize else []
+    result = subprocess.run(
+        [sys.executable, "-m", "samarium", *flags, program.name],
+        cwd=program.parent,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=300,
+        check=False,
+    )
+    return result.stdout + result.stderr
+
+
+def main(args: list[str]) -> int:
+    update = "--update" in args
+    names = [a.removesuffix(".sm") for a in args if a != "--update"]
+    programs = sorted(CASES.glob("*.sm"))
+    if names:
+        programs = [p for p in programs if p.stem in names]
+    failed = 0
+    for program in programs:
+        expected_path = program.with_suffix(".out")
+        if update:
+            expected_path.write_text(run(program, optimize=False))
+            print(f"updated {program.stem}")
+            continue
+        expected = expected_path.read_text()
+        for optimize in (False, True):
+            output = run(program, optimize=optimize)
+            if output == expected:
+                continue
+            failed += 1
+            label = f"{program.stem}{' (-O)' * optimize}"
+            print(f"FAIL {label}")
+            sys.stdout.writelines(
+                unified_diff(
+                    expected.splitlines(keepends=True),
+                    output.splitlines(keepends=True),
+                    "expected",
+                    "output",
+                )
+            )
+    if not update:
+        print(f"{len(programs) * 2 - failed}/{len(programs) * 2} passed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
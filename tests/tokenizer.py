@@ -0,0 +1,96 @@
+"""Checks that the tokenizer matches the crossandra-based tokenizer it replaced
+
+Both tokenizers are run over the standard library, the code blocks in the docs,
+the regression programs and a seeded corpus of random token soup; the token
+streams (or error messages) must be identical. Requires `crossandra`.
+"""
+
+# ruff: noqa: INP001
+from __future__ import annotations
+
+import random
+import re
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from crossandra import Crossandra, Rule, common
+from samarium import tokenizer
+from samarium.tokens import Token
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+RANDOM_PROGRAMS = 30_000
+
+PIECES = [
+    *(token.value for token in Token),
+    *("/", "\\", "`", "/\\/", "\\`/", "x", "abc", "_", "1", "é"),
+    *('"s"', '"a\\"b"', '"x\\\\"', '"', "$", "=", "!", "+", ">", "\x00"),
+    *("==", "==<", ">==", "==< c >==", "== c\n"),
+    *(" ", "\n", "\t", "\r\n"),
+]
+
+Result = tuple[bool, object]
+
+
+def crossandra_tokenizer() -> Crossandra:
+    return Crossandra(
+        Token,
+        ignore_whitespace=True,
+        rules=[
+            Rule(r"==<.*>==", flags=re.M | re.S, ignore=True),
+            Rule(r"==[^\n]*", flags=re.M | re.S, ignore=True),
+            Rule(
+                common.DOUBLE_QUOTED_STRING.pattern,
+                tokenizer.to_string,
+                flags=re.S,
+            ),
+            Rule(
+                rf"{tokenizer.SM_BIT}+`?{tokenizer.SM_BIT}*|`{tokenizer.SM_BIT}*",
+                tokenizer.to_number,
+            ),
+            Rule(r"\w+"),
+        ],
+    )
+
+
+def corpus() -> list[str]:
+    programs = [p.read_text() for p in (ROOT / "src/samarium/modules").glob("*.sm")]
+    programs += [p.read_text() for p in (ROOT / "tests/cases").glob("*.sm")]
+    for doc in (ROOT / "docs").glob("*.md"):
+        programs += re.findall(r"```sm\n(.*?)```", doc.read_text(), re.S)
+    rng = random.Random(0)
+    programs += [
+        "".join(rng.choices(PIECES, k=rng.randint(0, 25)))
+        for _ in range(RANDOM_PROGRAMS)
+    ]
+    return programs
+
+
+def run(tokenize: Callable[[str], list], code: str) -> Result:
+    try:
+        return True, [(type(token), token) for token in tokenize(code)]
+    except Exception as e:  # noqa: BLE001
+        return False, str(e)
+
+
+def main() -> int:
+    old = crossandra_tokenizer().tokenize
+    new = tokenizer.scan
+    programs = corpus()
+    mismatches = 0
+    for code in programs:
+        expected, output = run(old, code), run(lambda c: new(c)[0], code)
+        if expected == output:
+            continue
+        mismatches += 1
+        if mismatches <= 5:
+            print(f"{code!r}\n  crossandra: {expected}\n  tokenizer:  {output}")
+    print(f"{len(programs) - mismatches}/{len(programs)} programs tokenized equally")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())